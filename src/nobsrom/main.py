@@ -1,12 +1,29 @@
+import array
+import base64
 import curses
+import heapq
+import json
 import os
+import pickle
+import shlex
+import signal
 import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from typing import NamedTuple
 
 import yaml
 from platformdirs import user_config_path
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
@@ -35,11 +52,107 @@ class Colors(Enum):
     STATUS_BAR = 6
 
 
+class RomEntry(NamedTuple):
+    """
+    A ROM together with the system it belongs to, as listed in the "all" and
+    "favorites" views.
+
+    Attributes:
+        system (str): The name of the system the ROM belongs to.
+        path (str): The file path of the ROM.
+    """
+
+    system: str
+    path: str
+
+
 class EmulatorLauncher:
     """
     EmulatorLauncher is a class that manages the launching and navigation of ROMs for various emulators.
     """
 
+    _HELP_FILTER = "ESC:Exit │ ENTER/A:Launch │ F2/X:Favorite │ Q/B:Quit"
+    """The key bindings shown in the filter bar while filtering."""
+
+    _HELP_FILTER_LEN = len(_HELP_FILTER)
+
+    _HELP_READY = "/:Search │ ENTER/A:Launch │ F2/X:Favorite │ Q/B:Quit"
+    """The key bindings shown in the filter bar while navigating."""
+
+    _HELP_READY_LEN = len(_HELP_READY)
+
+    _CHR = tuple(chr(i) for i in range(128))
+    """The one-character strings of the ASCII codes, so typing doesn't call `chr`."""
+
+    _REPEAT_DELAY_NS = 300_000_000
+    """The time a gamepad direction must be held before it auto-repeats, in nanoseconds."""
+
+    _REPEAT_INTERVAL_NS = 40_000_000
+    """The time between auto-repeats of a held gamepad direction, in nanoseconds."""
+
+    _FRAME_INTERVAL_NS = 1_000_000_000 // 60
+    """The minimum time between redraws, in nanoseconds."""
+
+    _SCROLL_INTERVAL_NS = 100_000_000
+    """The time between steps of the selected ROM's scrolling name, in nanoseconds."""
+
+    _GAMEPAD_POLL_NS = 100_000_000
+    """The longest time between reads of the gamepad's events, in nanoseconds.
+
+    SDL events don't wake up `getch`, so this is how late a button press can be
+    noticed, traded against waking up less often while the gamepad is idle.
+    Held directions also wake the loop when they are due to repeat.
+    """
+
+    _EMULATOR_POLL_NS = 250_000_000
+    """The longest time between checks of a running emulator process, in nanoseconds.
+
+    SIGCHLD doesn't wake up `getch` on every platform, so this bounds how long a
+    finished emulator can leave the screen stale.
+    """
+
+    _HOTPLUG_INTERVAL_NS = 1_000_000_000
+    """The time between checks for a newly connected gamepad while there is none, in nanoseconds.
+
+    This keeps an idle launcher without a gamepad waking up once a second, in
+    exchange for noticing a gamepad plugged in after startup.
+    """
+
+    _SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+    """The units used by `format_size`, each 1024 times the previous one."""
+
+    _SAVE_DELAY_NS = 500_000_000
+    """The time the favorites must be left unchanged before they are saved, in nanoseconds."""
+
+    _DIR_KEYS = (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_LEFT, curses.KEY_RIGHT)
+    """The key sent by each gamepad direction, indexed like `_DIRECTIONS`."""
+
+    _DIRECTIONS = (
+        (0, 0, 1, 1, -1),
+        (1, 0, -1, 1, 1),
+        (2, -1, 0, 0, -1),
+        (3, 1, 0, 0, 1),
+    )
+    """The (direction, hat x, hat y, axis, axis sign) of each gamepad direction.
+
+    A direction is held if the D-pad points that way or the stick is pushed along
+    the axis in the direction of the sign, see `_AXIS_PRESS`. A hat value of 0
+    matches any value.
+    """
+
+    _AXIS_PRESS = 0.6
+    """How far the stick must be pushed along an axis for its direction to be held."""
+
+    _AXIS_RELEASE = 0.4
+    """How far the stick must come back for a held direction to be released.
+
+    Being lower than `_AXIS_PRESS`, a stick resting near the threshold doesn't
+    flicker between held and released.
+    """
+
+    _FAVORITES_JOURNAL_LIMIT = 1024
+    """The size in bytes above which the favorites journal is merged into the favorites file."""
+
     def __init__(self):
         # config
         self.app_name = "nobsrom"
@@ -60,18 +173,89 @@ class EmulatorLauncher:
         self.favorites_file = self.config_dir / "favorites.yaml"
         """The file path for the favorites file."""
 
+        self.favorites_journal = self.config_dir / "favorites.log"
+        """The file path for the journal of favorite changes not yet merged into the favorites file."""
+
+        self.yaml_cache_file = self.config_dir / ".yaml_cache.pkl"
+        """The file path for the pickled copies of the parsed YAML files."""
+
         self.config = self.load_config()
         """The loaded configuration dictionary."""
 
+        self.launch_argv = self.split_launch_arguments()
+        """A dictionary mapping each system to its (arguments, placeholder indices) launch template."""
+
+        self.rom_dirs = self.resolve_rom_dirs()
+        """A dictionary mapping each system to its ROM directories, with `~` expanded."""
+
+        self._can_compact_favorites = True
+        """Whether `compact_favorites` may rewrite the favorites, which would lose them if they couldn't be read."""
+
         self.favorites = self.load_favorites()
         """The loaded favorites dictionary."""
 
+        self._saved_favorites = {
+            system: list(roms) for system, roms in self.favorites.items()
+        }
+        """The favorites as stored by the favorites file and journal together, kept by the save thread."""
+
+        self._favorite_set = set()
+        """The (system, path) pairs of all favorite ROMs."""
+
+        self._favorite_paths = {}
+        """Maps the path of each favorite ROM to the number of systems it is a favorite under."""
+
+        self._fav_count = 0
+        """The total number of favorite entries across all systems."""
+        self.rebuild_favorite_set()
+
+        self.rom_sizes = {}
+        """A dictionary mapping ROM paths to their file sizes in bytes."""
+
+        self.rom_size_strs = {}
+        """A dictionary mapping ROM paths to their file sizes formatted by `format_size`."""
+
+        self.rom_names = {}
+        """A dictionary mapping ROM paths to their file names."""
+
+        self.rom_names_lower = {}
+        """A dictionary mapping ROM paths to their lowercased file names."""
+
         self.roms = self.get_roms()
         """A dictionary of ROMs categorized by system."""
 
         self.all_roms = self.combine_all_roms(self.roms)
         """A list of all ROMs across all systems."""
 
+        self._trigram_index = {}
+        """Maps each 3-character substring of a lowercased ROM name to the indices of `all_roms` containing it."""
+
+        self._all_names_lower = []
+        """The lowercased name of each ROM in `all_roms`, at the same index."""
+
+        self._index_dirty = True
+        """Whether the trigram index needs to be rebuilt before it is used."""
+
+        self._system_names = ()
+        """The names of all configured systems, in display order."""
+
+        self._system_labels = []
+        """The text shown for each system in the system window."""
+
+        self._all_label = ""
+        """The text shown for the "All" entry in the system window."""
+
+        self._favorites_label = ""
+        """The text shown for the favorites entry in the system window."""
+
+        self._fav_count_dirty = True
+        """Whether the favorites label needs to be recomputed."""
+
+        self._separator = ""
+        """The separator line below the "All" entry, rebuilt when the system window width changes."""
+
+        self.rebuild_system_labels()
+
         self.selected_system = 0
         """The index of the currently selected system."""
 
@@ -93,38 +277,134 @@ class EmulatorLauncher:
         self.emulator_process = None
         """The process object for the running emulator."""
 
+        self._child_exited = False
+        """Whether a SIGCHLD arrived since the emulator process was last polled."""
+
+        self._has_sigchld = hasattr(signal, "SIGCHLD")
+        """Whether the platform reports child exits with SIGCHLD, so the emulator needn't be polled every tick."""
+
         self.focus = "systems"
         """The current focus of the application (either 'systems' or 'roms')."""
 
         self.filter_string = ""
-        """The string used to filter ROMs."""
+        """The string used to filter ROMs, joined from `_filter_chars` by `update_filtered_roms`."""
+
+        self._filter_chars = []
+        """The characters typed into the filter, so typing appends instead of copying the string."""
 
         self.filtered_roms = {}
         """A dictionary of filtered ROMs based on the filter string and view mode."""
 
-        self.last_selection_change_time = 0
-        """The timestamp of the last selection change."""
+        self._filter_results_stale = False
+        """Whether the filter string changed since `filtered_roms` was last updated."""
+
+        self._filter_history = []
+        """The (lowercased filter, view mode, filtered ROMs) results for each prefix of the filter typed so far."""
+
+        self._current_rom_list = []
+        """The filtered ROM list of the current view, cached by `current_rom_list`."""
+
+        self._current_rom_key = None
+        """The (view mode, selected system) `_current_rom_list` was looked up for."""
+
+        self.last_selection_change_time_ns = 0
+        """The monotonic timestamp of the last selection change, in nanoseconds."""
+
+        self._rom_dirty = True
+        """Whether the ROM window needs to be redrawn."""
+
+        self._sys_dirty = True
+        """Whether the system window needs to be redrawn."""
+
+        self._filter_dirty = True
+        """Whether the filter bar needs to be redrawn."""
+
+        self._last_draw = 0
+        """The monotonic timestamp of the last full redraw, in nanoseconds."""
+
+        self._marquee_row = None
+        """The (y, marquee_text, cycle_length, name_width, attr) of the selected row if its name needs scrolling."""
+
+        self._scrolling_active = False
+        """Whether the selected ROM's name is wider than its row, so the marquee timer has to run."""
+
+        self._last_rom_lines = []
+        """The (text, attr) drawn on each row of the ROM window, so unchanged rows are not redrawn."""
 
         self.mode = "navigate"
         """The current mode of the application (either 'navigate' or 'filter')."""
 
+        self._filter_dispatch = {
+            key: getattr(self, handler.__name__)
+            for key, handler in self._FILTER_HANDLERS.items()
+        }
+        """`_FILTER_HANDLERS` bound to this launcher, so a key costs one lookup and one call."""
+
+        self._navigate_dispatch = {
+            key: getattr(self, handler.__name__)
+            for key, handler in self._NAVIGATE_HANDLERS.items()
+        }
+        """`_NAVIGATE_HANDLERS` bound to this launcher, so a key costs one lookup and one call."""
+
         self.view_mode = "favorites" if self.favorites else "systems"
         """The current view mode (either 'favorites' or 'systems')."""
 
         self.joystick = None
         """The joystick object for gamepad support."""
 
-        self.first_axis_event = {"up": 0, "down": 0, "left": 0, "right": 0}
-        """The timestamp of the first axis event for each direction."""
+        self._attr_header = 0
+        """The cached curses attribute for the HEADER color pair."""
+
+        self._attr_selected = 0
+        """The cached curses attribute for the SELECTED color pair."""
+
+        self._attr_favorite = 0
+        """The cached curses attribute for the FAVORITE color pair."""
+
+        self._attr_normal = 0
+        """The cached curses attribute for the NORMAL color pair."""
+
+        self._attr_highlight = 0
+        """The cached curses attribute for the HIGHLIGHT color pair."""
+
+        self._attr_status_bar = 0
+        """The cached curses attribute for the STATUS_BAR color pair."""
+
+        self._hat = (0, 0)
+        """The last (x, y) position of the gamepad's D-pad, as reported by its events."""
+
+        self._axes = [0.0, 0.0]
+        """The last x and y positions of the gamepad's stick, as reported by its events."""
+
+        self._stick_held = [False] * 4
+        """Whether the stick holds each direction of `_DIRECTIONS`, with hysteresis."""
+
+        self._repeat_timers = array.array("q", [0] * 8)
+        """The auto-repeat timers (monotonic ns) of each gamepad direction, or 0 if released.
 
-        self.last_axis_event = {"up": 0, "down": 0, "left": 0, "right": 0}
-        """The timestamp of the last axis event for each direction."""
+        Direction `i` of `_DIRECTIONS` keeps the time it was first held at index
+        `2 * i` and the time it next sends a key at index `2 * i + 1`. The D-pad
+        and the stick share these, so holding both sends each key once.
+        """
+
+        self._pending_changes = []
+        """The favorite changes waiting to be appended to the journal by the save thread."""
+
+        self._save_lock = threading.Lock()
+        """The lock guarding `_pending_changes`."""
+
+        self._save_event = threading.Event()
+        """The event signalling the save thread that there is work to do."""
 
-        self.first_hat_event = {"up": 0, "down": 0, "left": 0, "right": 0}
-        """The timestamp of the first hat event for each direction."""
+        self._save_stopping = False
+        """Whether the save thread should exit after writing pending favorites."""
 
-        self.last_hat_event = {"up": 0, "down": 0, "left": 0, "right": 0}
-        """The timestamp of the last hat event for each direction."""
+        self._last_change_time = 0
+        """The `time.monotonic_ns()` time of the last favorite change, guarded by `_save_lock`."""
+
+        self._save_thread = threading.Thread(target=self.save_loop, daemon=True)
+        """The background thread that writes favorites to disk."""
+        self._save_thread.start()
 
     def load_config(self):
         """
@@ -132,7 +412,8 @@ class EmulatorLauncher:
         This method attempts to load the configuration from a file specified by
         `self.config_file`. If the file does not exist, it creates a default
         configuration file. If an error occurs during loading, it prints an error
-        message and returns the default configuration.
+        message and returns the default configuration. `load_yaml_cached` reuses
+        the copy parsed by an earlier run if the file is unchanged.
         Returns:
             dict: The loaded configuration as a dictionary. If the configuration
             file does not exist or an error occurs, returns the default configuration.
@@ -141,12 +422,55 @@ class EmulatorLauncher:
             if not self.config_file.exists():
                 self.create_default_config()
 
-            with open(self.config_file, "r") as f:
-                return yaml.safe_load(f) or {}
+            return self.load_yaml_cached(self.config_file, self.config_file.stat())
         except Exception as e:
             print(f"Error loading config: {e}")
             return self.create_default_config()
 
+    def load_yaml_cached(self, path, stat):
+        """
+        Loads a YAML file, reusing the parsed copy pickled by an earlier run.
+
+        The parsed contents of each file are pickled to `self.yaml_cache_file`
+        together with the file's modification time and size. If both still
+        match, the pickle is loaded instead of parsing the YAML again, which is
+        much faster for a large favorites file.
+
+        Args:
+            path (Path): The YAML file to load.
+            stat (os.stat_result): The current stat of `path`.
+
+        Returns:
+            dict: The parsed contents of the file, or an empty dictionary if it
+                  is empty.
+        """
+        key = str(path)
+        cache = {}
+        try:
+            with open(self.yaml_cache_file, "rb") as f:
+                cache = pickle.load(f)
+        except Exception:
+            pass
+        if not isinstance(cache, dict):
+            cache = {}
+
+        entry = cache.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+
+        cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        temp_file = self.yaml_cache_file.with_name(self.yaml_cache_file.name + ".tmp")
+        try:
+            with open(temp_file, "wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.yaml_cache_file)
+        except OSError as e:
+            print(f"Error writing YAML cache: {e}")
+        return data
+
     def create_default_config(self):
         """
         Creates and saves a default configuration for the ROM launcher.
@@ -169,6 +493,68 @@ class EmulatorLauncher:
         self.save_config(default_config)
         return default_config
 
+    def split_launch_arguments(self):
+        """
+        Splits the launch arguments of every configured system into argument lists.
+
+        The arguments are split with `shlex`, so quoted arguments containing spaces
+        stay together, and the positions of the arguments containing the
+        "{rom_path}" placeholder are recorded so launching only has to substitute
+        those. Arguments with unbalanced quotes are reported and split on
+        whitespace instead.
+
+        Returns:
+            dict: A dictionary where the keys are system names and the values are
+                  (arguments, placeholder indices) tuples.
+        """
+        posix = os.name != "nt"
+        launch_argv = {}
+        for system, config in self.config["systems"].items():
+            arguments = config.get("launch_arguments") or ""
+            try:
+                args = shlex.split(arguments, posix=posix)
+            except ValueError as e:
+                print(f"Warning: Invalid launch arguments for {system}: {e}")
+                args = arguments.split()
+            else:
+                if not posix:
+                    # Non-POSIX mode keeps the quotes around quoted arguments
+                    args = [self.strip_quotes(arg) for arg in args]
+            placeholders = [i for i, arg in enumerate(args) if "{rom_path}" in arg]
+            launch_argv[system] = (args, placeholders)
+        return launch_argv
+
+    def strip_quotes(self, arg):
+        """
+        Removes a matching pair of quotes surrounding an argument.
+
+        Args:
+            arg (str): An argument split by `shlex` in non-POSIX mode.
+
+        Returns:
+            str: The argument without its surrounding quotes.
+        """
+        if len(arg) >= 2 and arg[0] == arg[-1] and arg[0] in "\"'":
+            return arg[1:-1]
+        return arg
+
+    def resolve_rom_dirs(self):
+        """
+        Expands the ROM directories of every configured system.
+
+        Each configured path has `~` expanded once, so `get_roms` can scan the
+        result without expanding anything again. Paths that can't be read are
+        reported by `get_roms` when it scans them.
+
+        Returns:
+            dict: A dictionary mapping each system name to a list of its ROM
+                  directories.
+        """
+        return {
+            system: [os.path.expanduser(path) for path in config.get("paths", [])]
+            for system, config in self.config["systems"].items()
+        }
+
     def save_config(self, config=None):
         """
         Save the current configuration to a file.
@@ -182,42 +568,282 @@ class EmulatorLauncher:
             IOError: If there is an error writing to the file.
         """
         config = config or self.config
-        with open(self.config_file, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+        with open(self.config_file, "w", encoding="utf-8") as f:
+            yaml.dump(
+                config,
+                f,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+                allow_unicode=True,
+            )
 
     def load_favorites(self):
         """
         Loads the favorites from a YAML file.
         This method attempts to load the favorites from a specified YAML file.
-        If the file does not exist, it returns an empty dictionary. If there is
-        an error during the loading process, it catches the exception, prints
-        an error message, and returns an empty dictionary.
+        If the file does not exist, it starts from an empty dictionary. If the
+        file can't be loaded, it prints an error message, moves the file aside
+        with `set_aside_favorites` and starts from an empty dictionary. Like
+        `load_config`, it reuses the copy parsed by an earlier run. Changes recorded in the favorites journal since it was last merged are
+        then applied on top.
         Returns:
             dict: A dictionary containing the favorites loaded from the YAML file,
                   or an empty dictionary if the file does not exist or an error occurs.
         """
+        favorites = {}
         try:
-            if not self.favorites_file.exists():
-                return {}
+            if self.favorites_file.exists():
+                favorites = self.load_yaml_cached(
+                    self.favorites_file, self.favorites_file.stat()
+                )
+                # File names stored by `quote_yaml_string` as !!binary
+                for roms in favorites.values():
+                    for i, rom in enumerate(roms):
+                        if isinstance(rom, bytes):
+                            roms[i] = os.fsdecode(rom)
+        except Exception as e:
+            print(f"Error loading favorites: {e}")
+            favorites = {}
+            self.set_aside_favorites()
 
-            with open(self.favorites_file, "r") as f:
-                return yaml.safe_load(f) or {}
+        try:
+            if self.favorites_journal.exists():
+                with open(self.favorites_journal, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            self.apply_favorite_change(favorites, json.loads(line))
+                        except (ValueError, KeyError, TypeError, AttributeError):
+                            # A line cut short by a crash while appending
+                            continue
         except Exception as e:
             print(f"Error loading favorites: {e}")
-            return {}
+            # Compacting would drop the changes that couldn't be replayed
+            self._can_compact_favorites = False
+        return favorites
+
+    def set_aside_favorites(self):
+        """
+        Moves an unreadable favorites file to a backup next to it.
 
-    def save_favorites(self):
+        The next compaction then writes a new favorites file instead of
+        overwriting the old one. If the file can't be moved, compaction is
+        turned off so it is left as it is.
         """
-        Saves the current list of favorite ROMs to a file.
+        backup = self.favorites_file.with_name(self.favorites_file.name + ".bak")
+        try:
+            os.replace(self.favorites_file, backup)
+            print(f"Moved unreadable favorites to {backup}")
+        except OSError as e:
+            print(f"Error moving unreadable favorites aside: {e}")
+            self._can_compact_favorites = False
+
+    def apply_favorite_change(self, favorites, change):
+        """
+        Applies one journaled favorite change to a favorites dictionary.
+
+        Adding a favorite that is already present or removing one that isn't does
+        nothing, so replaying a journal that was already merged is harmless.
+
+        Args:
+            favorites (dict): The favorites dictionary to update.
+            change (dict): The change, with "op" set to "add" or "remove", and the
+                "system" and "path" of the ROM.
+        """
+        system, rom_path = change["system"], change["path"]
+        roms = favorites.get(system)
+        if change["op"] == "add":
+            if roms is None:
+                favorites[system] = [rom_path]
+            elif rom_path not in roms:
+                roms.append(rom_path)
+        elif roms is not None and rom_path in roms:
+            roms.remove(rom_path)
+            if not roms:
+                del favorites[system]
+
+    def save_favorite_change(self, op, system, rom_path):
+        """
+        Saves a single change to the favorites.
 
-        This method writes the contents of the `self.favorites` list to the file
-        specified by `self.favorites_file` in YAML format.
+        This method hands the change to the background save thread, which appends
+        it to `self.favorites_journal` as a line of JSON, so a toggle costs the
+        same however many favorites there are. Changes made in quick succession
+        are appended in a single write, and the UI never waits on the disk.
+
+        Args:
+            op (str): "add" or "remove".
+            system (str): The system to which the ROM belongs.
+            rom_path (str): The file path of the ROM.
+        """
+        with self._save_lock:
+            self._pending_changes.append({"op": op, "system": system, "path": rom_path})
+            self._last_change_time = time.monotonic_ns()
+        self._save_event.set()
+
+    def save_loop(self):
+        """
+        Writes pending favorite changes to disk until `shutdown` is called.
+
+        Runs on the background save thread. After being woken up it waits until
+        the favorites have been left unchanged for `_SAVE_DELAY_NS`, so a burst
+        of toggles is coalesced into a single write. `shutdown` cuts the wait short.
+        """
+        while True:
+            self._save_event.wait()
+            while not self._save_stopping:
+                with self._save_lock:
+                    remaining = (
+                        self._last_change_time
+                        + self._SAVE_DELAY_NS
+                        - time.monotonic_ns()
+                    )
+                if remaining <= 0:
+                    break
+                # Woken early by another change or by `shutdown`
+                self._save_event.clear()
+                self._save_event.wait(remaining / 1_000_000_000)
+
+            with self._save_lock:
+                changes = self._pending_changes
+                self._pending_changes = []
+                self._save_event.clear()
+
+            if changes:
+                try:
+                    self.append_favorites_journal(changes)
+                except Exception as e:
+                    print(f"Error saving favorites: {e}")
+
+            if self._save_stopping:
+                return
+
+    def append_favorites_journal(self, changes):
+        """
+        Appends favorite changes to the favorites journal.
+
+        Once the journal grows past `_FAVORITES_JOURNAL_LIMIT` bytes it is merged
+        into the favorites file by `compact_favorites`.
+
+        Args:
+            changes (list): The changes, as passed to `apply_favorite_change`.
+
+        Raises:
+            IOError: If the journal cannot be opened or written to.
+        """
+        for change in changes:
+            self.apply_favorite_change(self._saved_favorites, change)
+        with open(self.favorites_journal, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(change) + "\n" for change in changes)
+            size = f.tell()
+        if size > self._FAVORITES_JOURNAL_LIMIT:
+            self.compact_favorites()
+
+    def compact_favorites(self):
+        """
+        Merges the favorites journal into the favorites file.
+
+        The full favorites are written first and the journal is removed after, so
+        a crash in between only leaves changes that are replayed harmlessly.
+        Does nothing if the favorites couldn't be read, so they are never
+        overwritten; the journal keeps collecting the changes then.
+
+        Raises:
+            IOError: If the favorites file cannot be written.
+        """
+        if not self._can_compact_favorites:
+            return
+        self.write_favorites(
+            {system: list(roms) for system, roms in self._saved_favorites.items()}
+        )
+        try:
+            os.remove(self.favorites_journal)
+        except FileNotFoundError:
+            pass
+
+    def write_favorites(self, favorites):
+        """
+        Writes favorites to the favorites file.
+
+        The favorites always have the form `{system: [path, ...]}`, so the YAML is
+        emitted directly instead of going through the YAML dumper. It is written to
+        a temporary file which then replaces the favorites file, so an interrupted
+        write never leaves a truncated file behind.
+
+        Args:
+            favorites (dict): The favorites dictionary to write.
 
         Raises:
             IOError: If the file cannot be opened or written to.
         """
-        with open(self.favorites_file, "w") as f:
-            yaml.dump(self.favorites, f)
+        temp_file = self.favorites_file.with_name(self.favorites_file.name + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            if not favorites:
+                f.write("{}\n")
+            elif all(isinstance(system, str) for system in favorites):
+                for system, roms in favorites.items():
+                    if not roms:
+                        f.write(f"{self.quote_yaml_string(system)}: []\n")
+                        continue
+                    f.write(f"{self.quote_yaml_string(system)}:\n")
+                    f.writelines(f"- {self.quote_yaml_string(rom)}\n" for rom in roms)
+            else:
+                yaml.dump(favorites, f, Dumper=SafeDumper, allow_unicode=True)
+        os.replace(temp_file, self.favorites_file)
+
+    def quote_yaml_string(self, value):
+        """
+        Quotes a string as a YAML double-quoted scalar.
+
+        File names that aren't valid in the filesystem encoding contain lone
+        surrogates, which YAML can't represent as text, so those are written as
+        the `!!binary` file name instead and decoded again by `load_favorites`.
+
+        Args:
+            value (str): The string to quote.
+
+        Returns:
+            str: The quoted string, with backslashes, double quotes and any
+                 non-printable characters escaped.
+        """
+        if not value.isprintable() or "\u2028" in value or "\u2029" in value:
+            if any("\ud800" <= char <= "\udfff" for char in value):
+                encoded = base64.b64encode(os.fsencode(value)).decode("ascii")
+                return f'!!binary "{encoded}"'
+            escaped = []
+            for char in value:
+                if char in '\\"':
+                    escaped.append("\\" + char)
+                elif char.isprintable() and char not in "\u2028\u2029":
+                    escaped.append(char)
+                else:
+                    escaped.append(f"\\U{ord(char):08x}")
+            return '"' + "".join(escaped) + '"'
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    def shutdown(self):
+        """
+        Stops the background save thread, waiting for pending favorites to be written.
+        """
+        self._save_stopping = True
+        self._save_event.set()
+        self._save_thread.join()
+
+    def rebuild_favorite_set(self):
+        """
+        Rebuilds the favorite (system, path) pairs and path counts from `self.favorites`.
+
+        These and the favorites count are kept up to date by
+        `toggle_favorite_by_system_and_path`, so this only needs to run when the
+        favorites are loaded.
+        """
+        self._favorite_set = {
+            (system, rom) for system, roms in self.favorites.items() for rom in roms
+        }
+        self._favorite_paths = {}
+        for system, rom in self._favorite_set:
+            self._favorite_paths[rom] = self._favorite_paths.get(rom, 0) + 1
+        self._fav_count = sum(len(roms) for roms in self.favorites.values())
 
     def init_colors(self):
         """
@@ -248,6 +874,14 @@ class EmulatorLauncher:
             Colors.STATUS_BAR.value, curses.COLOR_BLACK, curses.COLOR_WHITE
         )
 
+        # Cache the attributes so the draw methods don't recompute them per row
+        self._attr_header = curses.color_pair(Colors.HEADER.value)
+        self._attr_selected = curses.color_pair(Colors.SELECTED.value)
+        self._attr_favorite = curses.color_pair(Colors.FAVORITE.value)
+        self._attr_normal = curses.color_pair(Colors.NORMAL.value)
+        self._attr_highlight = curses.color_pair(Colors.HIGHLIGHT.value)
+        self._attr_status_bar = curses.color_pair(Colors.STATUS_BAR.value)
+
     def draw_borders(self):
         """
         Draws borders and headers for the system and ROM windows.
@@ -260,84 +894,231 @@ class EmulatorLauncher:
         """
         # Draw system window border
         self.system_window.box()
-        self.system_window.addstr(
-            0, 2, "[ Systems ]", curses.color_pair(Colors.HEADER.value)
-        )
+        self.system_window.addstr(0, 2, "[ Systems ]", self._attr_header)
 
         # Draw ROM window border
         self.rom_window.box()
-        self.rom_window.addstr(
-            0, 2, "[ Games ]", curses.color_pair(Colors.HEADER.value)
-        )
+        self.rom_window.addstr(0, 2, "[ Games ]", self._attr_header)
 
     def get_roms(self):
         """
         Retrieves a list of ROMs from the configured paths for each system.
 
         This method iterates through the systems defined in the configuration,
-        collects ROM file paths from the specified directories, and organizes
-        them by system.
+        collects ROM file paths from the directories resolved by
+        `resolve_rom_dirs`, and organizes
+        them by system. Directories are read with `os.scandir`, and the size,
+        formatted size, file name and lowercased file name of each ROM are
+        recorded in `self.rom_sizes`, `self.rom_size_strs`, `self.rom_names` and
+        `self.rom_names_lower` so they don't have to be recomputed when sorting,
+        filtering or drawing.
+
+        The directories are scanned concurrently by `scan_rom_dir`, so ROMs
+        spread over several drives or mounts don't wait on each other. Systems
+        with `parallel_scan` enabled, typically ones whose ROMs live on a
+        network share, also have their files stat'ed concurrently so the scan
+        takes about as long as the slowest request instead of the sum of all
+        of them.
 
         Returns:
             dict: A dictionary where the keys are system names and the values
-                  are lists of ROM file paths.
+                  are lists of ROM file paths, sorted by lowercased file name.
 
         Raises:
-            Prints a warning message if a specified ROM path is invalid.
+            Prints a warning message for each ROM directory that can't be read.
         """
         roms = {}
-        for system, config in self.config["systems"].items():
-            roms[system] = []
-            for path in config.get("paths", []):
-                if os.path.isdir(path):
-                    roms[system].extend(
-                        [
-                            os.path.join(path, f)
-                            for f in os.listdir(path)
-                            if not f.startswith(".")
-                        ]
+        self.rom_sizes = {}
+        self.rom_names = {}
+        self.rom_names_lower = {}
+        self._index_dirty = True
+        scans = []
+        for system, paths in self.rom_dirs.items():
+            parallel = self.config["systems"][system].get("parallel_scan", False)
+            scans.extend((system, path, not parallel) for path in paths)
+        if len(scans) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(scans))) as executor:
+                results = list(
+                    executor.map(
+                        self.scan_rom_dir,
+                        [path for _, path, _ in scans],
+                        [stat for _, _, stat in scans],
                     )
-                else:
-                    print(f"Warning: Invalid ROM path for {system}: {path}")
+                )
+        else:
+            results = [self.scan_rom_dir(path, stat) for _, path, stat in scans]
+
+        pending = {}
+        for system in self.rom_dirs:
+            roms[system] = []
+            pending[system] = []
+        for (system, path, stat), scanned in zip(scans, results):
+            if scanned is None:
+                print(f"Warning: Invalid ROM path for {system}: {path}")
+                continue
+            for entry, size in scanned:
+                roms[system].append(entry.path)
+                self.rom_names[entry.path] = entry.name
+                self.rom_names_lower[entry.path] = entry.name.lower()
+                if not stat:
+                    pending[system].append(entry)
+                elif size is not None:
+                    self.rom_sizes[entry.path] = size
+
+        for system_roms in roms.values():
+            system_roms.sort(key=self.rom_names_lower.__getitem__)
+
+        for system, entries in pending.items():
+            if entries:
+                with ThreadPoolExecutor(max_workers=32) as executor:
+                    sizes = executor.map(self.get_entry_size, entries)
+                    for entry, size in zip(entries, sizes):
+                        if size is not None:
+                            self.rom_sizes[entry.path] = size
+        self.rom_size_strs = {
+            path: self.format_size(size) for path, size in self.rom_sizes.items()
+        }
         return roms
 
+    def scan_rom_dir(self, path, stat):
+        """
+        Lists the ROMs in one directory of a system.
+
+        This runs on the worker threads of `get_roms`, so it only reads the
+        filesystem and leaves recording the results to the caller.
+
+        Args:
+            path (str): The directory to scan.
+            stat (bool): Whether to read the size of each file here. Systems with
+                `parallel_scan` enabled have their sizes read separately.
+
+        Returns:
+            list or None: The (entry, size) pair of each ROM, with size None if it
+                wasn't read, or None if the directory can't be read.
+        """
+        try:
+            with os.scandir(path) as entries:
+                return [
+                    (entry, self.get_entry_size(entry) if stat else None)
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                ]
+        except OSError:
+            return None
+
+    def get_entry_size(self, entry):
+        """
+        Returns the size of a directory entry, or None if it can't be read.
+
+        Args:
+            entry (os.DirEntry): The directory entry of a ROM.
+
+        Returns:
+            int or None: The size of the file in bytes, or None on error.
+        """
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return None
+
+    def get_rom_name(self, rom_path):
+        """
+        Returns the file name of a ROM.
+
+        The name cached by `get_roms` is used when available. Favorites may
+        point at files that were not found during the scan, so those fall back
+        to computing the name from the path.
+
+        Args:
+            rom_path (str): The file path of the ROM.
+
+        Returns:
+            str: The file name of the ROM.
+        """
+        name = self.rom_names.get(rom_path)
+        if name is None:
+            name = os.path.basename(rom_path)
+        return name
+
+    def get_rom_name_lower(self, rom_path):
+        """
+        Returns the lowercased file name of a ROM, for case-insensitive filtering.
+
+        Like `get_rom_name`, this falls back to the path for favorites that were
+        not found during the scan, and caches the result in
+        `self.rom_names_lower` so it is only lowercased once.
+
+        Args:
+            rom_path (str): The file path of the ROM.
+
+        Returns:
+            str: The lowercased file name of the ROM.
+        """
+        name = self.rom_names_lower.get(rom_path)
+        if name is None:
+            name = os.path.basename(rom_path).lower()
+            self.rom_names_lower[rom_path] = name
+        return name
+
     def combine_all_roms(self, roms):
         """
-        Combines all ROMs from all systems into a list of (system, rom_path) tuples.
+        Combines all ROMs from all systems into a list of `RomEntry` tuples.
+
+        The per-system lists must already be sorted by lowercased name, as
+        returned by `get_roms`, so they can be merged instead of re-sorted.
 
         Args:
             roms (dict): A dictionary where keys are system names and values are lists of ROM paths.
 
         Returns:
-            list: A sorted list of tuples, where each tuple contains a system name and a ROM path.
+            list: A sorted list of `RomEntry` tuples, each holding a system name and a ROM path.
                   The list is sorted by the ROM name in a case-insensitive manner.
         """
-        all_roms = []
-        for system, system_roms in roms.items():
-            for rom in system_roms:
-                all_roms.append((system, rom))
-        return sorted(
-            all_roms, key=lambda x: os.path.basename(x[1]).lower()
-        )  # Sort by ROM name
+        # The per-system lists are already sorted, so merge them. Each ROM is
+        # decorated with its lowercased name and the position of its system,
+        # so the merge compares plain tuples without calling a key function
+        # and ties still keep the systems in order.
+        names_lower = self.rom_names_lower
+        systems = list(roms)
+        merged = heapq.merge(
+            *(
+                [(names_lower[rom], i, rom) for rom in system_roms]
+                for i, system_roms in enumerate(roms.values())
+            )
+        )
+        return [RomEntry(systems[i], rom) for _, i, rom in merged]
 
     def format_size(self, size):
         """
         Formats a given size in bytes into a human-readable string with appropriate units.
 
+        The unit is picked from the bit length of the size, since each unit is
+        10 bits, so the size is divided only once.
+
         Args:
             size (float): The size in bytes to be formatted.
 
         Returns:
             str: The formatted size string with units (B, KB, MB, GB, TB, or PB).
         """
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size < 1024:
-                if unit == "B":
-                    return f" {int(size)}{unit}"
-                else:
-                    return f" {size:.1f}{unit}"
-            size /= 1024
-        return f"{size:.1f}PB"
+        if size < 1024:
+            return f" {int(size)}B"
+        unit = min((int(size).bit_length() - 1) // 10, 5)
+        return f" {size / (1 << (10 * unit)):.1f}{self._SIZE_UNITS[unit]}"
+
+    def rebuild_system_labels(self):
+        """
+        Rebuilds the cached system names and the labels shown in the system window.
+
+        The labels only change when the ROMs are rescanned or the favorites change,
+        so they are formatted here once instead of on every redraw.
+        """
+        self._system_names = tuple(self.roms)
+        self._system_labels = [
+            f"▸ {system} ({len(self.roms[system])})" for system in self._system_names
+        ]
+        self._all_label = f"◆ All ({len(self.all_roms)})"
+        self._fav_count_dirty = True
 
     def draw_system_window(self):
         """
@@ -365,55 +1146,48 @@ class EmulatorLauncher:
             self.selected_system (int): The index of the currently selected system
                 in the systems list.
         """
-        self.system_window.clear()
+        self.system_window.erase()
         self.draw_borders()
+        win_height, win_width = self.system_window.getmaxyx()
         y, x = 1, 2  # Start below the border
 
         # Favorites view with icon
-        favorites_count = sum(len(roms) for roms in self.favorites.values())
-        fav_text = f"★ Favorites ({favorites_count})"
+        if self._fav_count_dirty:
+            self._favorites_label = f"★ Favorites ({self._fav_count})"
+            self._fav_count_dirty = False
+        fav_text = self._favorites_label
         if self.view_mode == "favorites":
-            self.system_window.addstr(
-                y, x, fav_text, curses.color_pair(Colors.SELECTED.value)
-            )
+            self.system_window.addstr(y, x, fav_text, self._attr_selected)
         else:
-            self.system_window.addstr(
-                y, x, fav_text, curses.color_pair(Colors.FAVORITE.value)
-            )
+            self.system_window.addstr(y, x, fav_text, self._attr_favorite)
         y += 1
 
         # ALL category with icon
-        all_text = f"◆ All ({len(self.all_roms)})"
+        all_text = self._all_label
         if self.view_mode == "all":
-            self.system_window.addstr(
-                y, x, all_text, curses.color_pair(Colors.SELECTED.value)
-            )
+            self.system_window.addstr(y, x, all_text, self._attr_selected)
         else:
-            self.system_window.addstr(
-                y, x, all_text, curses.color_pair(Colors.NORMAL.value)
-            )
+            self.system_window.addstr(y, x, all_text, self._attr_normal)
         y += 1
 
         # Separator with nice pattern
-        self.system_window.addstr(y, x, "─" * (self.system_window.getmaxyx()[1] - 4))
+        separator_width = win_width - 4
+        if len(self._separator) != separator_width:
+            self._separator = "─" * separator_width
+        self.system_window.addstr(y, x, self._separator)
         y += 1
 
         # Systems with ROM counts and icons
-        systems = list(self.roms.keys())
-        for i, system in enumerate(systems):
-            count = len(self.roms[system])
-            system_text = f"▸ {system} ({count})"
+        for i, system_text in enumerate(self._system_labels):
+            if y >= win_height - 1:  # Stop at the bottom border
+                break
             if self.view_mode == "systems" and i == self.selected_system:
-                self.system_window.addstr(
-                    y, x, system_text, curses.color_pair(Colors.SELECTED.value)
-                )
+                self.system_window.addstr(y, x, system_text, self._attr_selected)
             else:
-                self.system_window.addstr(
-                    y, x, system_text, curses.color_pair(Colors.NORMAL.value)
-                )
+                self.system_window.addstr(y, x, system_text, self._attr_normal)
             y += 1
 
-        self.system_window.refresh()
+        self.system_window.noutrefresh()
 
     def draw_rom_window(self):
         """
@@ -434,25 +1208,24 @@ class EmulatorLauncher:
             self.total_roms (int): Total number of ROMs in the current view.
             self.current_rom_index (int): Index of the currently selected ROM (1-based).
             self.focus (str): The current focus of the application ("roms" or other).
-            self.last_selection_change_time (float): Timestamp of the last selection change.
-        Raises:
-            Exception: If there is an error retrieving the file size of a ROM.
+            self.last_selection_change_time_ns (int): Monotonic timestamp of the last selection change.
+            self.rom_size_strs (dict): Dictionary mapping ROM paths to their formatted file sizes.
         """
-        self.rom_window.clear()
-        self.draw_borders()
+        self._marquee_row = None
+        self._scrolling_active = False
 
-        rom_list = []
-        if self.view_mode == "systems":
-            systems = list(self.roms.keys())
-            if systems:
-                selected_system_name = systems[self.selected_system]
-                rom_list = self.filtered_roms.get(selected_system_name, [])
-        elif self.view_mode == "all":
-            rom_list = self.filtered_roms.get("all", [])
-        elif self.view_mode == "favorites":
-            rom_list = self.filtered_roms.get("favorites", [])
+        rom_list = self.current_rom_list()
+
+        win_height, win_width = self.rom_window.getmaxyx()
 
-        viewable_height = self.rom_window.getmaxyx()[0] - 1  # Account for borders
+        # Only start from a blank window when the row cache doesn't match it,
+        # otherwise repaint just the rows that changed
+        last_lines = self._last_rom_lines
+        if len(last_lines) != win_height:
+            self.rom_window.erase()
+            self.draw_borders()
+            last_lines = self._last_rom_lines = [None] * win_height
+        viewable_height = win_height - 1  # Account for borders
         num_roms = len(rom_list)
 
         # Update counters
@@ -469,34 +1242,30 @@ class EmulatorLauncher:
                 top_index = self.selected_rom - (viewable_height // 2)
             top_index = max(0, min(top_index, num_roms - viewable_height + 1))
 
-        for i, rom_data in enumerate(rom_list[top_index : top_index + viewable_height]):
-            y = i + 1  # Start below the border
-            if y >= viewable_height:
-                break
+        # Whether a ROM is a favorite under any system
+        favorite_paths = self._favorite_paths
 
-            # Determine ROM display information
-            if self.view_mode in ["favorites", "all"]:
-                system, rom_path = rom_data
-                rom_name = f"[{system}] {os.path.basename(rom_path)}"
-            else:
-                rom_path = rom_data
-                rom_name = os.path.basename(rom_path)
+        # Name the visible ROMs for the view mode up front, so the row loop
+        # doesn't have to check it for every row
+        visible = rom_list[top_index : top_index + viewable_height - 1]
+        if self.view_mode == "systems":
+            rows = self._rom_rows_by_system(visible)
+        else:
+            rows = self._rom_rows_flat(visible)
 
+        y = 1  # Start below the border
+        for i, (rom_path, rom_name) in enumerate(rows):
             # Add favorite star if needed
-            if self.is_favorite(rom_path):
+            favored = rom_path in favorite_paths
+            if favored:
                 rom_name = "★ " + rom_name
             else:
                 rom_name = "  " + rom_name
 
             # Get file size
-            try:
-                size = os.path.getsize(rom_path)
-                file_size_str = self.format_size(size)
-            except Exception:
-                file_size_str = "N/A"
+            file_size_str = self.rom_size_strs.get(rom_path, "N/A")
 
             # Calculate display positions
-            win_width = self.rom_window.getmaxyx()[1]
             size_width = len(file_size_str) + 2
             name_width = win_width - size_width - 2
 
@@ -505,49 +1274,124 @@ class EmulatorLauncher:
                 self.focus == "roms"
             )
             if is_selected:
-                attr = curses.color_pair(Colors.SELECTED.value)
-            elif self.is_favorite(rom_path):
-                attr = curses.color_pair(Colors.FAVORITE.value)
+                attr = self._attr_selected
+            elif favored:
+                attr = self._attr_favorite
             else:
-                attr = curses.color_pair(Colors.NORMAL.value)
+                attr = self._attr_normal
 
             # Handle scrolling for long names
             if is_selected and len(rom_name) > name_width:
-                scroll_speed = 5
-                current_time = time.time()
-                time_since_selection = current_time - self.last_selection_change_time
-                scroll_offset = int(time_since_selection * scroll_speed)
-                scroll_offset = scroll_offset % (len(rom_name) + 5)
-                display_name = rom_name + "     " + rom_name
-                display_name = display_name[scroll_offset : scroll_offset + name_width]
+                self._marquee_row = (
+                    y,
+                    rom_name + "     " + rom_name,
+                    len(rom_name) + 5,
+                    name_width,
+                    attr,
+                )
+                self._scrolling_active = True
+                display_name = self.get_marquee_text()
             else:
                 display_name = rom_name[:name_width]
 
-            # Draw the ROM entry
-            self.rom_window.addstr(y, 2, display_name.ljust(name_width), attr)
-            self.rom_window.addstr(y, name_width + 2, file_size_str, attr)
+            # Draw the ROM entry if the row shows something else
+            line = (f"{display_name:<{name_width}}{file_size_str}", attr)
+            if last_lines[y] != line:
+                self.rom_window.addstr(y, 2, *line)
+                last_lines[y] = line
+            y += 1
+
+        # Blank the rows left over from a longer list
+        blank = (" " * (win_width - 4), 0)
+        for y in range(y, viewable_height):
+            if last_lines[y] != blank:
+                self.rom_window.addstr(y, 2, *blank)
+                last_lines[y] = blank
 
-        self.rom_window.refresh()
+        self.rom_window.noutrefresh()
 
-    def launch_rom(self, emulator_path, launch_arguments, rom_path, start_in_directory):
+    def _rom_rows_by_system(self, visible):
+        """
+        Returns the (path, name) of each visible ROM in the "systems" view.
+
+        Args:
+            visible (list): The ROM paths shown in the ROM window.
+
+        Returns:
+            list: A (ROM path, display name) pair for each ROM.
+        """
+        get_rom_name = self.get_rom_name
+        return [(rom_path, get_rom_name(rom_path)) for rom_path in visible]
+
+    def _rom_rows_flat(self, visible):
+        """
+        Returns the (path, name) of each visible ROM in the "all" and "favorites" views.
+
+        These views mix systems, so each name is prefixed with its system.
+
+        Args:
+            visible (list): The `RomEntry` tuples shown in the ROM window.
+
+        Returns:
+            list: A (ROM path, display name) pair for each ROM.
+        """
+        get_rom_name = self.get_rom_name
+        return [
+            (rom_path, f"[{system}] {get_rom_name(rom_path)}")
+            for system, rom_path in visible
+        ]
+
+    def get_marquee_text(self):
+        """
+        Returns the visible part of the selected ROM's scrolling name.
+
+        The name repeated with a gap is built once per redraw in `_marquee_row`, so
+        this only has to work out the offset, using integer nanosecond arithmetic.
+
+        Returns:
+            str: The slice of the name to display, based on the time elapsed since
+                 the selection last changed.
+        """
+        scroll_speed = 5  # Characters per second
+        y, marquee_text, cycle_length, name_width, attr = self._marquee_row
+        time_since_selection = time.monotonic_ns() - self.last_selection_change_time_ns
+        scroll_offset = time_since_selection * scroll_speed // 1_000_000_000
+        scroll_offset = scroll_offset % cycle_length
+        return marquee_text[scroll_offset : scroll_offset + name_width]
+
+    def draw_marquee(self):
+        """
+        Advances the scrolling name of the selected ROM.
+
+        Only the selected row is repainted, so the rest of the ROM window is left
+        untouched between full redraws. Does nothing if the selected ROM's name
+        fits in the window. Like the other draw methods, this only updates the
+        virtual screen; the caller sends it to the terminal with `_flush`.
+        """
+        if not self._scrolling_active:
+            return
+        y, marquee_text, cycle_length, name_width, attr = self._marquee_row
+        display_name = self.get_marquee_text()
+        self.rom_window.addstr(y, 2, display_name.ljust(name_width), attr)
+        self._last_rom_lines[y] = None
+        self.rom_window.noutrefresh()
+
+    def launch_rom(self, emulator_path, launch_argv, rom_path, start_in_directory):
         """
         Launches a ROM using the specified emulator and arguments.
         Args:
             emulator_path (str): The file path to the emulator executable.
-            launch_arguments (str): The arguments to pass to the emulator. Use "{rom_path}" as a placeholder for the ROM path.
+            launch_argv (tuple): The (arguments, placeholder indices) template from `split_launch_arguments`. Each argument at a placeholder index has "{rom_path}" replaced with the ROM path.
             rom_path (str): The file path to the ROM to be launched.
             start_in_directory (str): The directory to set as the working directory when launching the emulator.
         Raises:
             subprocess.CalledProcessError: If there is an error launching the emulator.
             FileNotFoundError: If the emulator executable is not found at the specified path.
         """
-        command = [emulator_path]
-        if launch_arguments:
-            args = launch_arguments.split()
-            for i, arg in enumerate(args):
-                if "{rom_path}" in arg:
-                    args[i] = arg.replace("{rom_path}", rom_path)
-            command.extend(args)
+        args, placeholders = launch_argv
+        command = [emulator_path, *args]
+        for i in placeholders:
+            command[i + 1] = args[i].replace("{rom_path}", rom_path)
 
         # print(f"Launching: {' '.join(command)}")
         try:
@@ -559,6 +1403,56 @@ class EmulatorLauncher:
         except FileNotFoundError:
             print(f"Emulator not found at: {emulator_path}")
 
+    def build_trigram_index(self):
+        """
+        Builds the trigram index used to speed up filtering.
+
+        Every 3-character substring of each ROM's lowercased name is mapped to
+        the set of indices in `self.all_roms` whose name contains it. The
+        lowercased names are also kept in a list parallel to `self.all_roms`,
+        so matches can be verified by index.
+        """
+        index = {}
+        names_lower = self.rom_names_lower
+        self._all_names_lower = [names_lower[entry.path] for entry in self.all_roms]
+        for i, name in enumerate(self._all_names_lower):
+            for trigram in {name[j : j + 3] for j in range(len(name) - 2)}:
+                index.setdefault(trigram, set()).add(i)
+        self._trigram_index = index
+        self._index_dirty = False
+
+    def match_all_roms(self, needle):
+        """
+        Finds the ROMs in `self.all_roms` whose name contains the given string.
+
+        The trigram index narrows the search down to the ROMs sharing every
+        trigram of the needle, and those candidates are then checked with a
+        plain substring test.
+
+        Args:
+            needle (str): The lowercased string to search for.
+
+        Returns:
+            list: Sorted indices into `self.all_roms` of the matching ROMs, or
+                  None if the needle is too short to use the index.
+        """
+        if len(needle) < 3:
+            return None
+        if self._index_dirty:
+            self.build_trigram_index()
+
+        buckets = []
+        for trigram in {needle[j : j + 3] for j in range(len(needle) - 2)}:
+            bucket = self._trigram_index.get(trigram)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        candidates = buckets[0].intersection(*buckets[1:])
+
+        names = self._all_names_lower
+        return sorted(i for i in candidates if needle in names[i])
+
     def update_filtered_roms(self):
         """
         Updates the list of filtered ROMs based on the filter string and view mode.
@@ -569,7 +1463,11 @@ class EmulatorLauncher:
         - "all": Filters all ROMs across all systems based on the filter string.
         - "favorites": Filters favorite ROMs based on the filter string.
         If the filter string is empty, the filtered ROMs list is set to the full list of ROMs
-        for the current view mode.
+        for the current view mode. The results for each prefix of the filter string typed so
+        far are kept, so deleting characters restores earlier results without filtering, and
+        appending characters narrows the results for the longest cached prefix down instead of
+        filtering every ROM again. Otherwise, filter strings of three or more characters are
+        looked up in the trigram index instead of scanning every ROM.
         Attributes:
             filter_string (str): The string used to filter ROMs.
             view_mode (str): The current view mode ("systems", "all", or "favorites").
@@ -578,7 +1476,14 @@ class EmulatorLauncher:
             filtered_roms (dict): A dictionary of filtered ROMs based on the filter string and view mode.
             get_favorite_roms_with_system (function): A function that returns favorite ROMs with their systems.
         """
-        if not self.filter_string:
+        self._current_rom_key = None
+        self._filter_results_stale = False
+        self.filter_string = "".join(self._filter_chars)
+        needle = self.filter_string.lower()
+        history = self._filter_history
+
+        if not needle:
+            history.clear()
             if self.view_mode == "systems":
                 self.filtered_roms = self.roms
             elif self.view_mode == "all":
@@ -587,28 +1492,105 @@ class EmulatorLauncher:
                 self.filtered_roms = {"favorites": self.get_favorite_roms_with_system()}
             return
 
+        names_lower = self.rom_names_lower
+
+        # Drop the cached results that aren't for a prefix of the needle
+        while history and not (
+            history[-1][1] == self.view_mode and needle.startswith(history[-1][0])
+        ):
+            history.pop()
+
+        if history and history[-1][0] == needle:
+            self.filtered_roms = history[-1][2]
+            return
+
+        if history:
+            # Appending characters can only narrow the previous results down
+            previous = history[-1][2]
+            if self.view_mode == "systems":
+                self.filtered_roms = {
+                    system: [rom for rom in roms if needle in names_lower[rom]]
+                    for system, roms in previous.items()
+                }
+            elif self.view_mode == "all":
+                self.filtered_roms = {
+                    "all": [
+                        rom_data
+                        for rom_data in previous["all"]
+                        if needle in names_lower[rom_data.path]
+                    ]
+                }
+            elif self.view_mode == "favorites":
+                self.filtered_roms = {
+                    "favorites": [
+                        rom_data
+                        for rom_data in previous["favorites"]
+                        if needle in self.get_rom_name_lower(rom_data.path)
+                    ]
+                }
+            history.append((needle, self.view_mode, self.filtered_roms))
+            return
+
         self.filtered_roms = {}
 
         if self.view_mode == "systems":
-            for system, roms in self.roms.items():
-                self.filtered_roms[system] = [
-                    rom
-                    for rom in roms
-                    if self.filter_string.lower() in os.path.basename(rom).lower()
-                ]
+            matches = self.match_all_roms(needle)
+            if matches is None:
+                for system, roms in self.roms.items():
+                    self.filtered_roms[system] = [
+                        rom for rom in roms if needle in names_lower[rom]
+                    ]
+            else:
+                for system in self.roms:
+                    self.filtered_roms[system] = []
+                for i in matches:
+                    system, rom = self.all_roms[i]
+                    self.filtered_roms[system].append(rom)
         elif self.view_mode == "all":
-            self.filtered_roms["all"] = [
-                (system, rom)
-                for system, rom in self.all_roms
-                if self.filter_string.lower() in os.path.basename(rom).lower()
-            ]
+            matches = self.match_all_roms(needle)
+            if matches is None:
+                self.filtered_roms["all"] = [
+                    entry
+                    for entry in self.all_roms
+                    if needle in names_lower[entry.path]
+                ]
+            else:
+                self.filtered_roms["all"] = [self.all_roms[i] for i in matches]
         elif self.view_mode == "favorites":
             favorite_roms = self.get_favorite_roms_with_system()
             self.filtered_roms["favorites"] = [
                 rom_data
                 for rom_data in favorite_roms
-                if self.filter_string.lower() in os.path.basename(rom_data[1]).lower()
+                if needle in self.get_rom_name_lower(rom_data.path)
             ]
+        history.append((needle, self.view_mode, self.filtered_roms))
+
+    def current_rom_list(self):
+        """
+        Returns the filtered ROM list shown for the current view.
+
+        The list is looked up once per view and selected system, and the lookup
+        is cached until the view changes or `update_filtered_roms` runs again.
+        Filter changes deferred by typing are applied here first.
+
+        Returns:
+            list: The ROM paths of the selected system in the "systems" view, or
+                  the `RomEntry` tuples of the "all" and "favorites" views.
+        """
+        if self._filter_results_stale:
+            self.update_filtered_roms()
+        key = (self.view_mode, self.selected_system)
+        if key != self._current_rom_key:
+            rom_list = []
+            if self.view_mode == "systems":
+                if self._system_names:
+                    system = self._system_names[self.selected_system]
+                    rom_list = self.filtered_roms.get(system, [])
+            elif self.view_mode in ("all", "favorites"):
+                rom_list = self.filtered_roms.get(self.view_mode, [])
+            self._current_rom_list = rom_list
+            self._current_rom_key = key
+        return self._current_rom_list
 
     def get_favorite_roms_with_system(self):
         """
@@ -616,16 +1598,15 @@ class EmulatorLauncher:
 
         This method iterates through the 'favorites' dictionary, which contains
         system names as keys and lists of favorite ROMs as values. It creates a
-        list of tuples, where each tuple contains a system name and a ROM name.
+        list of `RomEntry` tuples, each holding a system name and a ROM path.
 
         Returns:
-            list of tuple: A list of tuples, where each tuple contains a system
-            name (str) and a ROM name (str).
+            list of RomEntry: A list of (system, path) entries.
         """
         favorite_roms = []
         for system, roms in self.favorites.items():
             for rom in roms:
-                favorite_roms.append((system, rom))
+                favorite_roms.append(RomEntry(system, rom))
         return favorite_roms
 
     def toggle_favorite(self):
@@ -635,8 +1616,9 @@ class EmulatorLauncher:
         - In "systems" view mode: Toggle the favorite status of the selected ROM within the selected system.
         - In "all" view mode: Toggle the favorite status of the selected ROM from the complete list of ROMs.
         - In "favorites" view mode: Toggle the favorite status of the selected ROM from the list of favorite ROMs.
-        After toggling the favorite status, the method updates the filtered ROMs list and redraws the ROM window.
-        It also ensures that the ROM selection position is restored and within bounds.
+        After toggling the favorite status, the toggled ROM is removed from the filtered list in the favorites
+        view; the other views don't depend on favorites and are left as they are. The windows are marked for
+        redrawing, and the ROM selection position is restored and kept within bounds.
         Attributes:
             self.selected_rom (int): The index of the currently selected ROM.
             self.view_mode (str): The current view mode ("systems", "all", or "favorites").
@@ -645,48 +1627,41 @@ class EmulatorLauncher:
             self.favorites (dict): A dictionary containing favorite ROMs categorized by systems.
             self.selected_system (int): The index of the currently selected system.
         Methods:
-            self.save_favorites(): Saves the current state of favorite ROMs.
             self.toggle_favorite_by_system_and_path(system, rom_path): Toggles the favorite status of a ROM by system and path.
-            self.update_filtered_roms(): Updates the list of filtered ROMs based on the current view mode.
-            self.draw_rom_window(): Redraws the ROM window to reflect the current state.
         """
         current_rom_index = self.selected_rom  # Store the current ROM index
+        if self._filter_results_stale:
+            self.update_filtered_roms()
 
         if self.view_mode == "systems":
-            systems = list(self.roms.keys())
+            systems = self._system_names
             if systems:
                 selected_system_name = systems[self.selected_system]
                 rom_list = self.filtered_roms.get(selected_system_name, [])
                 if rom_list:
                     selected_rom_path = rom_list[current_rom_index]  # Use stored index
-
-                    if selected_system_name not in self.favorites:
-                        self.favorites[selected_system_name] = []
-
-                    if selected_rom_path in self.favorites[selected_system_name]:
-                        self.favorites[selected_system_name].remove(selected_rom_path)
-                    else:
-                        self.favorites[selected_system_name].append(selected_rom_path)
-
-                    if not self.favorites[selected_system_name]:
-                        del self.favorites[selected_system_name]
-
-                    self.save_favorites()
+                    self.toggle_favorite_by_system_and_path(
+                        selected_system_name, selected_rom_path
+                    )
         elif self.view_mode == "all":
-            rom_data = self.filtered_roms.get("all", [])[
-                current_rom_index
-            ]  # Use stored index
-            system, rom_path = rom_data
-            self.toggle_favorite_by_system_and_path(system, rom_path)
+            rom_list = self.filtered_roms.get("all", [])
+            if rom_list:
+                system, rom_path = rom_list[current_rom_index]  # Use stored index
+                self.toggle_favorite_by_system_and_path(system, rom_path)
         elif self.view_mode == "favorites":
-            rom_data = self.filtered_roms.get("favorites", [])[
-                current_rom_index
-            ]  # Use stored index
-            system, rom_path = rom_data
-            self.toggle_favorite_by_system_and_path(system, rom_path)
-
-        self.update_filtered_roms()
-        self.draw_rom_window()
+            rom_list = self.filtered_roms.get("favorites", [])
+            if rom_list:
+                system, rom_path = rom_list[current_rom_index]  # Use stored index
+                self.toggle_favorite_by_system_and_path(system, rom_path)
+                # Toggling in the favorites view always removes the ROM, so drop it
+                # from the filtered list instead of rebuilding the list. The
+                # results cached for shorter filters still list it, so forget them.
+                del rom_list[current_rom_index]
+                del self._filter_history[:-1]
+
+        # The systems and all views are filtered by name only, so they don't
+        # need to be refiltered when a favorite changes
+        self._rom_dirty = self._sys_dirty = self._filter_dirty = True
 
         # Restore the ROM selection position
         if self.view_mode == "systems":
@@ -705,40 +1680,38 @@ class EmulatorLauncher:
         Toggles the favorite status of a ROM by its system and path.
         If the ROM is already a favorite, it will be removed from the favorites list.
         If the ROM is not a favorite, it will be added to the favorites list.
+        The favorite lookups are updated alongside the list, so they never have to be
+        rebuilt.
         Args:
             system (str): The system to which the ROM belongs.
             rom_path (str): The file path of the ROM.
         Returns:
             None
         """
-        if system not in self.favorites:
-            self.favorites[system] = []
-
-        if rom_path in self.favorites[system]:
+        if (system, rom_path) in self._favorite_set:
             self.favorites[system].remove(rom_path)
+            self._fav_count -= 1
             if not self.favorites[system]:
                 del self.favorites[system]
+            self._favorite_set.discard((system, rom_path))
+            # The same file may still be a favorite under another system
+            if self._favorite_paths[rom_path] > 1:
+                self._favorite_paths[rom_path] -= 1
+            else:
+                del self._favorite_paths[rom_path]
         else:
-            self.favorites[system].append(rom_path)
-
-        self.save_favorites()
-        self.update_filtered_roms()
-        self.draw_rom_window()
-
-    def is_favorite(self, rom_path):
-        """
-        Check if a ROM is marked as a favorite.
-
-        Args:
-            rom_path (str): The file path of the ROM to check.
-
-        Returns:
-            bool: True if the ROM is a favorite, False otherwise.
-        """
-        for system, favorites in self.favorites.items():
-            if rom_path in favorites:
-                return True
-        return False
+            self.favorites.setdefault(system, []).append(rom_path)
+            self._fav_count += 1
+            self._favorite_set.add((system, rom_path))
+            self._favorite_paths[rom_path] = self._favorite_paths.get(rom_path, 0) + 1
+
+        self.save_favorite_change(
+            "add" if (system, rom_path) in self._favorite_set else "remove",
+            system,
+            rom_path,
+        )
+        self._fav_count_dirty = True
+        self._rom_dirty = self._sys_dirty = self._filter_dirty = True
 
     def handle_input(self, key):
         """
@@ -764,132 +1737,232 @@ class EmulatorLauncher:
             - F2 key (curses.KEY_F2): Toggle favorite status of the selected ROM if focus is on ROMs.
         Updates:
         - Updates the timestamp if any selection state changes.
-        - Redraws the ROM window, system window, and filter bar.
+        - Marks the windows for redrawing if any displayed state changes.
         """
         prev_selected_rom = self.selected_rom
         prev_view_mode = self.view_mode
         prev_selected_system = self.selected_system
+        prev_display_state = (self.focus, self.mode, len(self._filter_chars))
 
-        systems = list(self.roms.keys())
-        num_systems = len(systems)
+        if self.mode == "filter":
+            handler = self._filter_dispatch.get(key)
+            if handler is not None:
+                handler()
+            elif 32 <= key <= 126:  # Printable characters
+                self._on_printable(key)
+        else:  # Navigate mode
+            handler = self._navigate_dispatch.get(key)
+            if handler is not None:
+                handler()
 
-        rom_list = []
-        if self.view_mode == "systems" and systems:
-            selected_system_name = systems[self.selected_system]
-            rom_list = self.filtered_roms.get(selected_system_name, [])
-        elif self.view_mode == "all":
-            rom_list = self.filtered_roms.get("all", [])
-        elif self.view_mode == "favorites":
-            rom_list = self.filtered_roms.get("favorites", [])
+        # Update timestamp if any selection state changed
+        if (
+            prev_selected_rom != self.selected_rom
+            or prev_view_mode != self.view_mode
+            or prev_selected_system != self.selected_system
+        ):
+            self.last_selection_change_time_ns = time.monotonic_ns()
+            self._rom_dirty = self._sys_dirty = self._filter_dirty = True
+        elif prev_display_state != (self.focus, self.mode, len(self._filter_chars)):
+            self._rom_dirty = self._sys_dirty = self._filter_dirty = True
 
-        num_roms = len(rom_list)
+    def _on_escape(self):
+        """Leaves filter mode and clears the filter."""
+        self.mode = "navigate"
+        self._filter_chars.clear()
+        self.update_filtered_roms()
+        self.selected_rom = 0
 
-        if self.mode == "filter":
-            if key == 27:  # Escape key
-                self.mode = "navigate"
-                self.filter_string = ""
+    def _on_enter(self):
+        """Launches the selected ROM."""
+        self.launch_selected_rom(self._system_names, self.current_rom_list())
+
+    def _on_backspace(self):
+        """Removes the last character from the filter."""
+        if self._filter_chars:
+            self._filter_chars.pop()
+            self._filter_results_stale = True
+            self.selected_rom = 0
+
+    def _on_printable(self, key):
+        """Appends a typed character to the filter."""
+        self._filter_chars.append(self._CHR[key])
+        self._filter_results_stale = True
+        self.selected_rom = 0
+
+    def _on_filter_up(self):
+        """Moves the selection up the filtered ROM list, stopping at the top."""
+        if self.selected_rom > 0:
+            self.selected_rom -= 1
+
+    def _on_filter_down(self):
+        """Moves the selection down the filtered ROM list, stopping at the bottom."""
+        if self.selected_rom < len(self.current_rom_list()) - 1:
+            self.selected_rom += 1
+
+    def _on_favorite(self):
+        """Toggles the favorite status of the selected ROM if the ROMs have focus."""
+        if self.focus == "roms":
+            self.toggle_favorite()
+
+    def _on_up(self):
+        """Moves up the ROM list, wrapping around, or to the previous view."""
+        num_systems = len(self._system_names)
+        if self.focus == "roms":
+            num_roms = len(self.current_rom_list())
+            if num_roms > 0:
+                self.selected_rom = (self.selected_rom - 1) % num_roms
+        elif self.focus == "systems":
+            if self.view_mode == "favorites":
+                self.view_mode = "systems"
+                self.selected_system = num_systems - 1
+                self.selected_rom = 0
                 self.update_filtered_roms()
+            elif self.view_mode == "all" and num_systems > 0:
+                self.view_mode = "favorites"
                 self.selected_rom = 0
-            elif key == 10:  # Enter key in filter mode
-                self.launch_selected_rom(systems, rom_list)
-            elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
-                if self.filter_string:
-                    self.filter_string = self.filter_string[:-1]
-                    self.update_filtered_roms()
-                    self.selected_rom = 0
-            elif key == curses.KEY_UP:
-                if self.selected_rom > 0:
-                    self.selected_rom -= 1
-            elif key == curses.KEY_DOWN:
-                if self.selected_rom < num_roms - 1:
-                    self.selected_rom += 1
-            elif key == curses.KEY_F2:
-                if self.focus == "roms":
-                    self.toggle_favorite()
-            elif key >= 32 and key <= 126:  # Printable characters
-                self.filter_string += chr(key)
                 self.update_filtered_roms()
+            elif self.view_mode == "systems" and self.selected_system == 0:
+                self.view_mode = "all"
                 self.selected_rom = 0
-        else:  # Navigate mode
-            if key == curses.KEY_UP:
-                if self.focus == "roms" and num_roms > 0:
-                    self.selected_rom = (self.selected_rom - 1) % num_roms
-                elif self.focus == "systems":
-                    if self.view_mode == "favorites":
-                        self.view_mode = "systems"
-                        self.selected_system = num_systems - 1
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-                    elif self.view_mode == "all" and num_systems > 0:
-                        self.view_mode = "favorites"
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-                    elif self.view_mode == "systems" and self.selected_system == 0:
-                        self.view_mode = "all"
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-                    elif self.view_mode == "systems" and self.selected_system > 0:
-                        self.selected_system -= 1
-                        self.selected_rom = 0
-            elif key == curses.KEY_DOWN:
-                if self.focus == "roms" and num_roms > 0:
-                    self.selected_rom = (self.selected_rom + 1) % num_roms
-                elif self.focus == "systems":
-                    if self.view_mode == "favorites":
-                        self.view_mode = "all"
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-                    elif self.view_mode == "all" and num_systems > 0:
-                        self.view_mode = "systems"
-                        self.selected_system = 0
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-                    elif (
-                        self.view_mode == "systems"
-                        and self.selected_system < num_systems - 1
-                    ):
-                        self.selected_system += 1
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-                    elif (
-                        self.view_mode == "systems"
-                        and self.selected_system == num_systems - 1
-                    ):
-                        self.view_mode = "favorites"
-                        self.selected_rom = 0
-                        self.update_filtered_roms()
-            elif key == curses.KEY_LEFT:
-                self.focus = "systems"
-            elif key == curses.KEY_RIGHT:
-                self.focus = "roms"
-            elif key == ord("/"):
-                self.mode = "filter"
-                self.filter_string = ""
                 self.update_filtered_roms()
+            elif self.view_mode == "systems" and self.selected_system > 0:
+                self.selected_system -= 1
                 self.selected_rom = 0
-            elif key == 10:  # Enter key in navigate mode
-                self.launch_selected_rom(systems, rom_list)
-            elif key == curses.KEY_F2:
-                if self.focus == "roms":
-                    self.toggle_favorite()
 
-            # Update timestamp if any selection state changed
-        if (
-            prev_selected_rom != self.selected_rom
-            or prev_view_mode != self.view_mode
-            or prev_selected_system != self.selected_system
-        ):
-            self.last_selection_change_time = time.time()
+    def _on_down(self):
+        """Moves down the ROM list, wrapping around, or to the next view."""
+        num_systems = len(self._system_names)
+        if self.focus == "roms":
+            num_roms = len(self.current_rom_list())
+            if num_roms > 0:
+                self.selected_rom = (self.selected_rom + 1) % num_roms
+        elif self.focus == "systems":
+            if self.view_mode == "favorites":
+                self.view_mode = "all"
+                self.selected_rom = 0
+                self.update_filtered_roms()
+            elif self.view_mode == "all" and num_systems > 0:
+                self.view_mode = "systems"
+                self.selected_system = 0
+                self.selected_rom = 0
+                self.update_filtered_roms()
+            elif self.view_mode == "systems" and self.selected_system < num_systems - 1:
+                self.selected_system += 1
+                self.selected_rom = 0
+                self.update_filtered_roms()
+            elif (
+                self.view_mode == "systems" and self.selected_system == num_systems - 1
+            ):
+                self.view_mode = "favorites"
+                self.selected_rom = 0
+                self.update_filtered_roms()
 
-        self.draw_rom_window()
-        self.draw_system_window()
-        self.draw_filter_bar()
+    def _on_left(self):
+        """Moves the focus to the system window."""
+        self.focus = "systems"
+
+    def _on_right(self):
+        """Moves the focus to the ROM window."""
+        self.focus = "roms"
+
+    def _on_search(self):
+        """Enters filter mode with an empty filter."""
+        self.mode = "filter"
+        self._filter_chars.clear()
+        self.update_filtered_roms()
+        self.selected_rom = 0
+
+    _FILTER_HANDLERS = {
+        27: _on_escape,
+        10: _on_enter,
+        curses.KEY_BACKSPACE: _on_backspace,
+        127: _on_backspace,
+        8: _on_backspace,
+        curses.KEY_UP: _on_filter_up,
+        curses.KEY_DOWN: _on_filter_down,
+        curses.KEY_F2: _on_favorite,
+    }
+    """Maps each key handled in filter mode to its handler."""
+
+    _NAVIGATE_HANDLERS = {
+        curses.KEY_UP: _on_up,
+        curses.KEY_DOWN: _on_down,
+        curses.KEY_LEFT: _on_left,
+        curses.KEY_RIGHT: _on_right,
+        ord("/"): _on_search,
+        10: _on_enter,
+        curses.KEY_F2: _on_favorite,
+    }
+    """Maps each key handled in navigate mode to its handler."""
+
+    def _poll_repeat(self, idx, active, now):
+        """
+        Sends a key for a held gamepad direction, with delayed auto-repeat.
+
+        The key is sent once when the direction is first pressed, and then every
+        `_REPEAT_INTERVAL_NS` once it has been held for `_REPEAT_DELAY_NS`. Each
+        repeat schedules the next one an interval after it was due, so polling
+        jitter doesn't slow the repeat rate down; after a stall of more than an
+        interval the repeats missed in the meantime are dropped instead of being
+        sent as a burst to catch up, and the schedule keeps its phase.
+
+        Args:
+            idx (int): The index of the direction in `_DIRECTIONS`.
+            active (bool): Whether the direction is currently held.
+            now (int): The current time from `time.monotonic_ns()`.
+        """
+        timers = self._repeat_timers
+        pressed_since = idx << 1
+        next_fire_at = pressed_since | 1
+        if not active:
+            timers[pressed_since] = timers[next_fire_at] = 0
+        elif timers[pressed_since] == 0:
+            self.handle_input(self._DIR_KEYS[idx])
+            timers[pressed_since] = now
+            timers[next_fire_at] = now + self._REPEAT_DELAY_NS
+        elif now >= timers[next_fire_at]:
+            self.handle_input(self._DIR_KEYS[idx])
+            interval = self._REPEAT_INTERVAL_NS
+            due = timers[next_fire_at]
+            timers[next_fire_at] = due + ((now - due) // interval + 1) * interval
+
+    def _update_stick_held(self):
+        """
+        Updates which directions the stick holds from its position in `_axes`.
+
+        A direction is held once the stick is pushed past `_AXIS_PRESS` along it,
+        and released once the stick comes back within `_AXIS_RELEASE`.
+        """
+        stick_held = self._stick_held
+        axes = self._axes
+        for idx, _, _, axis, sign in self._DIRECTIONS:
+            push = axes[axis] * sign
+            stick_held[idx] = push > (
+                self._AXIS_RELEASE if stick_held[idx] else self._AXIS_PRESS
+            )
+
+    def _next_repeat_ns(self):
+        """
+        Returns when the next held gamepad direction is due to auto-repeat.
+
+        Returns:
+            int or None: The `time.monotonic_ns()` time of the next repeat, or
+                None if no direction is held.
+        """
+        timers = self._repeat_timers
+        next_ns = None
+        for next_fire_at in range(1, len(timers), 2):
+            due = timers[next_fire_at]
+            if due and (next_ns is None or due < next_ns):
+                next_ns = due
+        return next_ns
 
     def launch_selected_rom(self, systems, rom_list):
         """
         Launches the selected ROM using the appropriate emulator configuration.
         Args:
-            systems (list): A list of available systems.
+            systems (tuple): The names of the available systems.
             rom_list (list): A list of ROMs available for the selected system.
         Preconditions:
             - `self.focus` must be "roms".
@@ -909,32 +1982,31 @@ class EmulatorLauncher:
         """
         if self.focus == "roms" and self.emulator_process is None and rom_list:
             if self.view_mode == "systems":
-                system_config = self.config["systems"].get(
-                    systems[self.selected_system]
-                )
+                system = systems[self.selected_system]
+                system_config = self.config["systems"].get(system)
                 if system_config and rom_list:
                     start_in_directory = system_config.get("start_in")
                     self.launch_rom(
                         system_config["emulator_path"],
-                        system_config["launch_arguments"],
+                        self.launch_argv[system],
                         rom_list[self.selected_rom],
                         start_in_directory,
                     )
             elif self.view_mode in ["favorites", "all"] and rom_list:
-                system, rom_path = rom_list[self.selected_rom]
-                system_config = self.config["systems"].get(system)
+                entry = rom_list[self.selected_rom]
+                system_config = self.config["systems"].get(entry.system)
                 if system_config:
                     start_in_directory = system_config.get("start_in")
                     self.launch_rom(
                         system_config["emulator_path"],
-                        system_config["launch_arguments"],
-                        rom_path,
+                        self.launch_argv[entry.system],
+                        entry.path,
                         start_in_directory,
                     )
 
             # Clear filter and update display after launching
             self.mode = "navigate"
-            self.filter_string = ""
+            self._filter_chars.clear()
             self.update_filtered_roms()
             self.selected_rom = 0
 
@@ -955,8 +2027,7 @@ class EmulatorLauncher:
             counter (str): The string representing the current ROM count.
             status (str): The status message to be displayed.
             help_text (str): The help text with key bindings.
-            total_length (int): The total length of the status and help text.
-            padding (int): The padding to ensure the text fits within the window width.
+            status_width (int): The width the status is padded to.
             final_text (str): The final text to be displayed on the status bar.
         """
         height, width = self.stdscr.getmaxyx()
@@ -966,29 +2037,111 @@ class EmulatorLauncher:
         self.stdscr.clrtoeol()
 
         # Set status bar style
-        self.stdscr.attron(curses.color_pair(Colors.STATUS_BAR.value))
+        self.stdscr.attron(self._attr_status_bar)
 
         current_rom = self.current_rom_index if self.total_roms > 0 else 0
         counter = f" {current_rom}/{self.total_roms}"
 
         if self.mode == "filter":
-            status = f" / {self.filter_string}{counter}"
-            help_text = "ESC:Exit │ ENTER/A:Launch │ F2/X:Favorite │ Q/B:Quit"
+            status = f" / {''.join(self._filter_chars)}{counter}"
+            help_text, help_length = self._HELP_FILTER, self._HELP_FILTER_LEN
         else:
             status = f" Ready{counter}"
-            help_text = "/:Search │ ENTER/A:Launch │ F2/X:Favorite │ Q/B:Quit"
-
-        # Calculate padding, ensuring we don't exceed the window width
-        total_length = len(status) + len(help_text)
-        padding = max(0, width - total_length - 1)  # Leave one character at the end
+            help_text, help_length = self._HELP_READY, self._HELP_READY_LEN
 
-        # Ensure we don't write beyond the last column
-        final_text = (status + " " * padding + help_text)[: width - 1]
+        # Pad the status so the help text ends one character before the edge,
+        # and ensure we don't write beyond the last column
+        status_width = max(0, width - help_length - 1)
+        final_text = f"{status:<{status_width}}{help_text}"[: width - 1]
 
         # Draw status bar
         self.stdscr.addstr(height - 1, 0, final_text)
-        self.stdscr.attroff(curses.color_pair(Colors.STATUS_BAR.value))
-        self.stdscr.refresh()
+        self.stdscr.attroff(self._attr_status_bar)
+        self.stdscr.noutrefresh()
+
+    def _flush(self):
+        """
+        Sends everything the draw methods changed to the terminal in one write.
+
+        The draw methods only call `noutrefresh`, so a frame that touches several
+        windows is combined into a single minimal update here.
+        """
+        curses.doupdate()
+
+    def _redraw_if_dirty(self, now):
+        """
+        Redraws the windows marked dirty, at most once per `_FRAME_INTERVAL_NS`.
+
+        Input only updates state and marks windows dirty, so all the keys and
+        gamepad events handled since the last frame are shown in one redraw.
+
+        Args:
+            now (int): The current time, as returned by `time.monotonic_ns`.
+        """
+        if not (self._rom_dirty or self._sys_dirty or self._filter_dirty):
+            return
+        if now - self._last_draw < self._FRAME_INTERVAL_NS:
+            return
+        if self._sys_dirty:
+            self.draw_system_window()
+        if self._rom_dirty:
+            self.draw_rom_window()
+        if self._filter_dirty:
+            self.draw_filter_bar()
+        self._flush()
+        self._rom_dirty = self._sys_dirty = self._filter_dirty = False
+        self._last_draw = now
+
+    def _invalidate_screen(self):
+        """
+        Makes the next frame repaint the whole terminal.
+
+        The draw methods only send what changed since the last frame, so output
+        from elsewhere, like the emulator or SDL writing to the terminal, would
+        otherwise stay on screen.
+        """
+        self.stdscr.clearok(True)
+        self._last_rom_lines = []
+        self._rom_dirty = self._sys_dirty = self._filter_dirty = True
+
+    def _open_joystick(self, device_index):
+        """
+        Opens a gamepad and starts reading its input.
+
+        Args:
+            device_index (int): The SDL device index of the gamepad.
+        """
+        self.joystick = pygame.joystick.Joystick(device_index)
+        self.joystick.init()
+        # print("Controller connected:", self.joystick.get_name())
+        # Start from the current position; events only report changes
+        if self.joystick.get_numhats() > 0:
+            self._hat = self.joystick.get_hat(0)
+        for axis in range(min(2, self.joystick.get_numaxes())):
+            self._axes[axis] = self.joystick.get_axis(axis)
+
+    def _close_joystick(self):
+        """
+        Forgets a disconnected gamepad, releasing any direction it was holding.
+
+        If another gamepad is still connected, it is opened in its place.
+        """
+        self.joystick = None
+        self._hat = (0, 0)
+        for i in range(len(self._axes)):
+            self._axes[i] = 0.0
+        for i in range(len(self._stick_held)):
+            self._stick_held[i] = False
+        for i in range(len(self._repeat_timers)):
+            self._repeat_timers[i] = 0
+        if pygame.joystick.get_count() > 0:
+            self._open_joystick(0)
+
+    def _on_sigchld(self, signum, frame):
+        """
+        Notes that a child process exited, so the main loop polls the emulator.
+        """
+        self._child_exited = True
 
     def main(self, stdscr):
         """
@@ -1008,18 +2161,32 @@ class EmulatorLauncher:
         stdscr.clear()
         stdscr.refresh()
 
+        # Get told when the emulator exits instead of polling for it
+        if self._has_sigchld:
+            signal.signal(signal.SIGCHLD, self._on_sigchld)
+
         # Initialize pygame for gamepad support.
         pygame.init()
         pygame.joystick.init()
+        # Only queue the gamepad events, the window and other SDL events are
+        # never read and would just fill the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            [
+                pygame.JOYHATMOTION,
+                pygame.JOYAXISMOTION,
+                pygame.JOYBUTTONDOWN,
+                pygame.JOYDEVICEADDED,
+                pygame.JOYDEVICEREMOVED,
+            ]
+        )
         if pygame.joystick.get_count() > 0:
-            self.joystick = pygame.joystick.Joystick(0)
-            self.joystick.init()
-            # print("Controller connected:", self.joystick.get_name())
+            self._open_joystick(0)
         else:
             self.joystick = None
             # print("No controller found.")
-
-        stdscr.nodelay(True)
+        # SDL may have printed warnings over the screen while starting up
+        self._invalidate_screen()
 
         # Calculate split for windows.
         height, width = stdscr.getmaxyx()
@@ -1029,215 +2196,180 @@ class EmulatorLauncher:
         self.rom_window = curses.newwin(height - 1, rom_width, 0, system_width)
         self.mode = "navigate"
 
+        # The windows start out dirty, so the first pass of the loop draws them
         self.update_filtered_roms()
-        self.draw_system_window()
-        self.draw_rom_window()
-        self.draw_filter_bar()
-
-        # Timing parameters (in seconds)
-        initial_delay = 0.3  # Delay before auto-repeat kicks in
-        repeat_interval = 0.04  # Interval between repeats after initial delay
 
-        # Timing parameters for scroll updates
+        # Integer nanoseconds, like the rest of the loop's clock
         last_scroll_time = 0
-        scroll_interval = 0.1  # 100 milliseconds
+        scroll_interval = self._SCROLL_INTERVAL_NS
+        gamepad_poll = self._GAMEPAD_POLL_NS
+        hotplug_interval = self._HOTPLUG_INTERVAL_NS
+        next_hotplug_check = 0
+
+        # Bound once, as they are used on every gamepad poll
+        get_events = pygame.event.get
+        poll_repeat = self._poll_repeat
+        repeat_timers = self._repeat_timers
+        stick_held = self._stick_held
+        update_stick_held = self._update_stick_held
+        axes = self._axes
+        directions = self._DIRECTIONS
+        axis_press = self._AXIS_PRESS
+        monotonic_ns = time.monotonic_ns
 
         running = True
 
         while running:
-            current_time = time.time()
-
-            if current_time - last_scroll_time >= scroll_interval:
-                self.draw_rom_window()
-                self.draw_filter_bar()
+            current_time = monotonic_ns()
+
+            if self._rom_dirty or self._sys_dirty or self._filter_dirty:
+                self._redraw_if_dirty(current_time)
+            elif (
+                self._scrolling_active
+                and current_time - last_scroll_time >= scroll_interval
+            ):
+                self.draw_marquee()
+                self._flush()
                 last_scroll_time = current_time
 
-            # Process keyboard input.
+            # Block in getch until a key is pressed or the next redraw or poll
+            # is due. There is always a deadline: without a gamepad the loop
+            # still wakes every `_HOTPLUG_INTERVAL_NS` to notice one being
+            # plugged in, as SDL events can't wake up getch.
+            deadline = None
+            if self._rom_dirty or self._sys_dirty or self._filter_dirty:
+                deadline = self._last_draw + self._FRAME_INTERVAL_NS
+            elif self._scrolling_active:
+                deadline = last_scroll_time + scroll_interval
+            if self.emulator_process is not None:
+                emulator_deadline = current_time + self._EMULATOR_POLL_NS
+                if deadline is None or emulator_deadline < deadline:
+                    deadline = emulator_deadline
+            if self.joystick is not None:
+                # Wake up when a held direction is due to repeat, and otherwise
+                # only read the gamepad's events every `_GAMEPAD_POLL_NS`
+                gamepad_deadline = current_time + gamepad_poll
+                repeat_deadline = self._next_repeat_ns()
+                if repeat_deadline is not None and repeat_deadline < gamepad_deadline:
+                    gamepad_deadline = repeat_deadline
+                if deadline is None or gamepad_deadline < deadline:
+                    deadline = gamepad_deadline
+            elif deadline is None or next_hotplug_check < deadline:
+                deadline = next_hotplug_check
+            stdscr.timeout(max(0, (deadline - current_time) // 1_000_000 + 1))
+
+            # Process keyboard input, draining every pending key before the
+            # next redraw so held keys don't queue up behind the drawing.
             key = stdscr.getch()
             if key != -1:
+                stdscr.timeout(0)
+
+            # Check if the emulator process has finished before handling the
+            # input it gates. With SIGCHLD this only needs to happen after a
+            # child exited; the signal may be delivered to another thread, or
+            # getch may be restarted after it, so it can't be relied on to wake
+            # up getch, but its handler always runs in this thread as soon as
+            # getch returns, at the latest after `_EMULATOR_POLL_NS`.
+            if self.emulator_process and (self._child_exited or not self._has_sigchld):
+                self._child_exited = False
+                if self.emulator_process.poll() is not None:
+                    self.emulator_process = None
+                    # Repaint over anything the emulator wrote to the terminal
+                    self._invalidate_screen()
+            while key != -1:
                 if key == curses.KEY_RESIZE:
                     # Handle window resize
                     curses.resize_term(*stdscr.getmaxyx())
                     height, width = stdscr.getmaxyx()
                     system_width = width // 4
                     rom_width = width - system_width
-                    self.system_window = curses.newwin(height - 1, system_width, 0, 0)
-                    self.rom_window = curses.newwin(
-                        height - 1, rom_width, 0, system_width
-                    )
-                    stdscr.clear()
+                    # Reuse the windows; only their geometry changed
+                    self.system_window.resize(height - 1, system_width)
+                    self.rom_window.resize(height - 1, rom_width)
+                    self.rom_window.mvwin(0, system_width)
+                    stdscr.erase()
+                    stdscr.noutrefresh()
                     curses.curs_set(0)  # Re-hide cursor after resize
-                    self.init_colors()  # Re-initialize colors if necessary
-                    self.update_filtered_roms()
-                    self.draw_system_window()
-                    self.draw_rom_window()
-                    self.draw_filter_bar()
+                    self._last_rom_lines = []
+                    self._rom_dirty = self._sys_dirty = self._filter_dirty = True
                 elif (
                     key == ord("q")
                     and self.emulator_process is None
                     and self.mode == "navigate"
                 ):
+                    running = False
                     break
                 self.handle_input(key)
+                key = stdscr.getch()
+            if not running:
+                break
 
-            # Process pygame events for button presses.
-            for event in pygame.event.get():
-                if event.type == pygame.JOYBUTTONDOWN:
-                    if event.button == 0:  # Typically A button.
-                        self.handle_input(10)  # Enter key.
-                    elif event.button == 1:  # Typically B button.
-                        running = False
-                    elif event.button == 2:  # Example: X button.
-                        self.handle_input(curses.KEY_F2)
-                # We poll the hat state below for auto-repeat.
-
-            now = time.time()
-            if self.joystick is not None:
-                # ----- Process D-pad (hat) with initial delay auto-repeat -----
-                hat_x, hat_y = self.joystick.get_hat(0)
-                # For UP
-                if hat_y == 1:
-                    if self.first_hat_event["up"] == 0:
-                        self.handle_input(curses.KEY_UP)
-                        self.first_hat_event["up"] = now
-                        self.last_hat_event["up"] = now
-                    elif (
-                        now - self.first_hat_event["up"] >= initial_delay
-                        and now - self.last_hat_event["up"] >= repeat_interval
-                    ):
-                        self.handle_input(curses.KEY_UP)
-                        self.last_hat_event["up"] = now
-                else:
-                    self.first_hat_event["up"] = 0
-                    self.last_hat_event["up"] = 0
-
-                # For DOWN
-                if hat_y == -1:
-                    if self.first_hat_event["down"] == 0:
-                        self.handle_input(curses.KEY_DOWN)
-                        self.first_hat_event["down"] = now
-                        self.last_hat_event["down"] = now
-                    elif (
-                        now - self.first_hat_event["down"] >= initial_delay
-                        and now - self.last_hat_event["down"] >= repeat_interval
-                    ):
-                        self.handle_input(curses.KEY_DOWN)
-                        self.last_hat_event["down"] = now
-                else:
-                    self.first_hat_event["down"] = 0
-                    self.last_hat_event["down"] = 0
-
-                # For RIGHT
-                if hat_x == 1:
-                    if self.first_hat_event["right"] == 0:
-                        self.handle_input(curses.KEY_RIGHT)
-                        self.first_hat_event["right"] = now
-                        self.last_hat_event["right"] = now
-                    elif (
-                        now - self.first_hat_event["right"] >= initial_delay
-                        and now - self.last_hat_event["right"] >= repeat_interval
-                    ):
-                        self.handle_input(curses.KEY_RIGHT)
-                        self.last_hat_event["right"] = now
-                else:
-                    self.first_hat_event["right"] = 0
-                    self.last_hat_event["right"] = 0
-
-                # For LEFT
-                if hat_x == -1:
-                    if self.first_hat_event["left"] == 0:
-                        self.handle_input(curses.KEY_LEFT)
-                        self.first_hat_event["left"] = now
-                        self.last_hat_event["left"] = now
-                    elif (
-                        now - self.first_hat_event["left"] >= initial_delay
-                        and now - self.last_hat_event["left"] >= repeat_interval
-                    ):
-                        self.handle_input(curses.KEY_LEFT)
-                        self.last_hat_event["left"] = now
-                else:
-                    self.first_hat_event["left"] = 0
-                    self.last_hat_event["left"] = 0
-
-                # ----- Process Joystick Axes if D-pad is neutral -----
-                if (hat_x, hat_y) == (0, 0):
-                    axis_x = self.joystick.get_axis(0)
-                    axis_y = self.joystick.get_axis(1)
-
-                    # For UP
-                    if axis_y < -0.5:
-                        if self.first_axis_event["up"] == 0:
-                            self.handle_input(curses.KEY_UP)
-                            self.first_axis_event["up"] = now
-                            self.last_axis_event["up"] = now
-                        elif (
-                            now - self.first_axis_event["up"] >= initial_delay
-                            and now - self.last_axis_event["up"] >= repeat_interval
-                        ):
-                            self.handle_input(curses.KEY_UP)
-                            self.last_axis_event["up"] = now
-                    else:
-                        self.first_axis_event["up"] = 0
-                        self.last_axis_event["up"] = 0
-
-                    # For DOWN
-                    if axis_y > 0.5:
-                        if self.first_axis_event["down"] == 0:
-                            self.handle_input(curses.KEY_DOWN)
-                            self.first_axis_event["down"] = now
-                            self.last_axis_event["down"] = now
-                        elif (
-                            now - self.first_axis_event["down"] >= initial_delay
-                            and now - self.last_axis_event["down"] >= repeat_interval
-                        ):
-                            self.handle_input(curses.KEY_DOWN)
-                            self.last_axis_event["down"] = now
-                    else:
-                        self.first_axis_event["down"] = 0
-                        self.last_axis_event["down"] = 0
-
-                    # For LEFT
-                    if axis_x < -0.5:
-                        if self.first_axis_event["left"] == 0:
-                            self.handle_input(curses.KEY_LEFT)
-                            self.first_axis_event["left"] = now
-                            self.last_axis_event["left"] = now
-                        elif (
-                            now - self.first_axis_event["left"] >= initial_delay
-                            and now - self.last_axis_event["left"] >= repeat_interval
-                        ):
-                            self.handle_input(curses.KEY_LEFT)
-                            self.last_axis_event["left"] = now
-                    else:
-                        self.first_axis_event["left"] = 0
-                        self.last_axis_event["left"] = 0
-
-                    # For RIGHT
-                    if axis_x > 0.5:
-                        if self.first_axis_event["right"] == 0:
-                            self.handle_input(curses.KEY_RIGHT)
-                            self.first_axis_event["right"] = now
-                            self.last_axis_event["right"] = now
-                        elif (
-                            now - self.first_axis_event["right"] >= initial_delay
-                            and now - self.last_axis_event["right"] >= repeat_interval
+            if self.joystick is not None or current_time >= next_hotplug_check:
+                next_hotplug_check = current_time + hotplug_interval
+                # Process every queued pygame event in one batch, alongside the
+                # keys, before the next redraw. The D-pad and stick positions
+                # are kept from their motion events instead of being read from
+                # the joystick on every poll. Gamepads connected or
+                # disconnected while running are picked up from their events.
+                for event in get_events():
+                    if event.type == pygame.JOYDEVICEADDED:
+                        if self.joystick is None:
+                            self._open_joystick(event.device_index)
+                    elif event.type == pygame.JOYDEVICEREMOVED:
+                        if (
+                            self.joystick is not None
+                            and event.instance_id == self.joystick.get_instance_id()
                         ):
-                            self.handle_input(curses.KEY_RIGHT)
-                            self.last_axis_event["right"] = now
-                    else:
-                        self.first_axis_event["right"] = 0
-                        self.last_axis_event["right"] = 0
+                            self._close_joystick()
+                    elif event.type == pygame.JOYHATMOTION:
+                        if event.hat == 0:
+                            self._hat = event.value
+                    elif event.type == pygame.JOYAXISMOTION:
+                        if event.axis < 2:
+                            axes[event.axis] = event.value
+                    elif event.type == pygame.JOYBUTTONDOWN:
+                        if event.button == 0:  # Typically A button.
+                            self.handle_input(10)  # Enter key.
+                        elif event.button == 1:  # Typically B button.
+                            running = False
+                            break
+                        elif event.button == 2:  # Example: X button.
+                            self.handle_input(curses.KEY_F2)
+                if not running:
+                    break
 
-            # Check if the emulator process has finished.
-            if self.emulator_process and self.emulator_process.poll() is not None:
-                self.emulator_process = None
+            if self.joystick is not None:
+                hat_x, hat_y = self._hat
+                axis_x, axis_y = axes
+
+                # A released direction clears its timers, so with the pad
+                # neutral and no timer running there is nothing to fire or reset
+                if not (
+                    hat_x == 0
+                    and hat_y == 0
+                    and -axis_press <= axis_x <= axis_press
+                    and -axis_press <= axis_y <= axis_press
+                    and not any(repeat_timers)
+                ):
+                    now = monotonic_ns()
 
-            time.sleep(0.01)
+                    # ----- Process D-pad and stick with initial delay auto-repeat -----
+                    update_stick_held()
+                    for idx, want_x, want_y, _, _ in directions:
+                        active = (
+                            hat_x == want_x if want_x else hat_y == want_y
+                        ) or stick_held[idx]
+                        poll_repeat(idx, active, now)
 
 
 def main():
     launcher = EmulatorLauncher()
-    curses.wrapper(launcher.main)
+    # Exit normally on SIGTERM so the favorites are still flushed below
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    try:
+        curses.wrapper(launcher.main)
+    finally:
+        launcher.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,289 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import yaml
+
+from nobsrom import main
+
+
+class FakeWindow:
+    """A stand-in for a curses window that records what is drawn on it."""
+
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.erased = False
+        self.cleared = False
+        self.rows = []
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def erase(self):
+        self.erased = True
+
+    def box(self):
+        pass
+
+    def addstr(self, y, x, text, attr=0):
+        self.rows.append(y)
+
+    def noutrefresh(self):
+        pass
+
+    def clearok(self, flag):
+        self.cleared = flag
+
+
+class LauncherTestCase(unittest.TestCase):
+    """Runs each test against a launcher with its own configuration directory."""
+
+    ROM_NAMES = ["Game 0.nes", "Game 1.nes", "Game 2.nes"]
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        rom_dir = self.tmp / "roms"
+        rom_dir.mkdir()
+        for i, name in enumerate(self.ROM_NAMES):
+            (rom_dir / name).write_bytes(b"x" * i)
+        (self.tmp / "config.yaml").write_text(
+            "systems:\n"
+            "  NES:\n"
+            "    emulator_path: emulator\n"
+            "    launch_arguments: '{rom_path}'\n"
+            f"    paths: ['{rom_dir}']\n",
+            encoding="utf-8",
+        )
+        patcher = mock.patch.object(
+            main, "user_config_path", lambda *args, **kwargs: self.tmp
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_launcher(self):
+        launcher = main.EmulatorLauncher()
+        self.addCleanup(launcher.shutdown)
+        return launcher
+
+
+class RomWindowRepaintTest(LauncherTestCase):
+    def setUp(self):
+        super().setUp()
+        self.launcher = self.make_launcher()
+        self.launcher.stdscr = FakeWindow(24, 80)
+        self.launcher.system_window = FakeWindow(23, 20)
+        self.launcher.rom_window = FakeWindow(23, 60)
+        self.launcher.update_filtered_roms()
+        self.launcher.draw_rom_window()
+
+    def redraw(self):
+        window = self.launcher.rom_window = FakeWindow(23, 60)
+        self.launcher.draw_rom_window()
+        return window
+
+    def test_unchanged_rows_are_not_repainted(self):
+        window = self.redraw()
+        self.assertFalse(window.erased)
+        self.assertEqual(window.rows, [])
+
+    def test_invalidated_screen_repaints_every_row(self):
+        self.launcher._invalidate_screen()
+        window = self.redraw()
+        self.assertTrue(self.launcher.stdscr.cleared)
+        self.assertTrue(window.erased)
+        self.assertEqual(set(window.rows), set(range(23 - 1)))
+
+
+class FilterHistoryTest(LauncherTestCase):
+    ROM_NAMES = [
+        "Super Mario Bros.nes",
+        "Super Mario Bros 3.nes",
+        "Dr. Mario.nes",
+        "Metroid.nes",
+        "Mega Man 2.nes",
+        "Marble Madness.nes",
+        "Zelda.nes",
+        "Kid Icarus.nes",
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.launcher = self.make_launcher()
+        self.launcher.view_mode = "all"
+        self.launcher.update_filtered_roms()
+
+    def expected(self, needle, entries=None):
+        """Filters from scratch, without the results cached for shorter filters."""
+        launcher = self.launcher
+        if entries is None:
+            matches = launcher.match_all_roms(needle)
+            if matches is not None:
+                return [launcher.all_roms[i] for i in matches]
+            entries = launcher.all_roms
+        return [
+            entry
+            for entry in entries
+            if needle in os.path.basename(entry.path).lower()
+        ]
+
+    def type(self, text):
+        for char in text:
+            self.launcher._on_printable(ord(char))
+            self.launcher.update_filtered_roms()
+
+    def backspace(self, count):
+        for _ in range(count):
+            self.launcher._on_backspace()
+            self.launcher.update_filtered_roms()
+
+    def test_typing_narrows_the_results(self):
+        for char in "mario":
+            self.type(char)
+            needle = self.launcher.filter_string
+            self.assertEqual(self.launcher.filtered_roms["all"], self.expected(needle))
+        self.assertEqual(len(self.launcher._filter_history), len("mario"))
+
+    def test_backspace_restores_the_earlier_results(self):
+        self.type("mario")
+        self.backspace(2)
+        history = self.launcher._filter_history
+        self.assertEqual(len(history), len("mar"))
+        self.assertIs(self.launcher.filtered_roms, history[-1][2])
+        self.assertEqual(self.launcher.filtered_roms["all"], self.expected("mar"))
+        self.type("b")
+        self.assertEqual(self.launcher.filtered_roms["all"], self.expected("marb"))
+
+    def test_removed_favorite_is_not_restored(self):
+        launcher = self.launcher
+        for system, rom_path in launcher.all_roms:
+            launcher.toggle_favorite_by_system_and_path(system, rom_path)
+        launcher.view_mode = "favorites"
+        launcher.focus = "roms"
+        launcher.update_filtered_roms()
+        self.type("mar")
+        removed = launcher.current_rom_list()[0]
+        launcher.selected_rom = 0
+        launcher.toggle_favorite()
+        self.backspace(2)
+        favorites = launcher.get_favorite_roms_with_system()
+        self.assertNotIn(removed, favorites)
+        self.assertEqual(launcher.current_rom_list(), self.expected("m", favorites))
+
+
+class LaunchArgumentsTest(LauncherTestCase):
+    def split(self, arguments):
+        launcher = self.make_launcher()
+        launcher.config["systems"]["NES"]["launch_arguments"] = arguments
+        return launcher.split_launch_arguments()["NES"]
+
+    def test_quoted_argument_stays_together(self):
+        args, placeholders = self.split('-L "cores/my core.so" {rom_path}')
+        self.assertEqual(args, ["-L", "cores/my core.so", "{rom_path}"])
+        self.assertEqual(placeholders, [2])
+
+    def test_quotes_are_stripped_without_posix(self):
+        with mock.patch.object(main.os, "name", "nt"):
+            args, placeholders = self.split(
+                '-L "C:\\Program Files\\cores\\fceumm.dll" {rom_path}'
+            )
+        self.assertEqual(
+            args, ["-L", "C:\\Program Files\\cores\\fceumm.dll", "{rom_path}"]
+        )
+
+    def test_unbalanced_quote_falls_back_to_whitespace(self):
+        with mock.patch("builtins.print"):
+            args, placeholders = self.split("--title Mario's {rom_path}")
+        self.assertEqual(args, ["--title", "Mario's", "{rom_path}"])
+        self.assertEqual(placeholders, [2])
+
+
+class FavoritesFileTest(LauncherTestCase):
+    NAMES = [
+        "Plain.nes",
+        'Quote " and \\ backslash.nes',
+        "Tab\there.nes",
+        "Line\u2028separator.nes",
+        "Ünïcödé ★.nes",
+        "#: - [not yaml] &x *y.nes",
+        "Bad \udcff byte.nes",
+    ]
+
+    def test_quoted_names_load_back(self):
+        launcher = self.make_launcher()
+        for name in self.NAMES:
+            loaded = yaml.load(launcher.quote_yaml_string(name), Loader=main.SafeLoader)
+            if isinstance(loaded, bytes):
+                loaded = os.fsdecode(loaded)
+            self.assertEqual(loaded, name)
+
+    def test_favorites_load_back(self):
+        paths = [f"/roms/{name}" for name in self.NAMES]
+        self.make_launcher().write_favorites({"NES": paths})
+        self.assertEqual(self.make_launcher().favorites, {"NES": paths})
+
+    def test_unreadable_favorites_are_kept(self):
+        (self.tmp / "favorites.yaml").write_text("NES: [unclosed\n", encoding="utf-8")
+        (self.tmp / "favorites.log").write_text(
+            '{"op": "add", "system": "NES", "path": "/roms/Game.nes"}\n',
+            encoding="utf-8",
+        )
+        with mock.patch("builtins.print"):
+            launcher = self.make_launcher()
+        self.assertEqual(launcher.favorites, {"NES": ["/roms/Game.nes"]})
+        launcher.compact_favorites()
+        self.assertEqual(
+            (self.tmp / "favorites.yaml.bak").read_text(encoding="utf-8"),
+            "NES: [unclosed\n",
+        )
+        self.assertEqual(self.make_launcher().favorites, {"NES": ["/roms/Game.nes"]})
+
+
+class JoystickHotplugTest(LauncherTestCase):
+    def test_remaining_gamepad_is_opened_after_removal(self):
+        launcher = self.make_launcher()
+        launcher.joystick = mock.Mock()
+        launcher._repeat_timers[0] = 1
+        remaining = mock.Mock()
+        remaining.get_numhats.return_value = 0
+        remaining.get_numaxes.return_value = 0
+        with mock.patch.object(main.pygame.joystick, "get_count", return_value=1):
+            with mock.patch.object(
+                main.pygame.joystick, "Joystick", return_value=remaining
+            ) as joystick:
+                launcher._close_joystick()
+        joystick.assert_called_once_with(0)
+        self.assertIs(launcher.joystick, remaining)
+        self.assertFalse(any(launcher._repeat_timers))
+
+    def test_no_gamepad_left_after_removal(self):
+        launcher = self.make_launcher()
+        launcher.joystick = mock.Mock()
+        with mock.patch.object(main.pygame.joystick, "get_count", return_value=0):
+            launcher._close_joystick()
+        self.assertIsNone(launcher.joystick)
+
+
+class StickHysteresisTest(LauncherTestCase):
+    def test_press_and_release_thresholds(self):
+        launcher = self.make_launcher()
+        down = 1
+        for axis_y, held in [
+            (0.5, False),  # Not pushed far enough to press
+            (0.7, True),
+            (0.5, True),  # Between the thresholds, still held
+            (0.3, False),
+            (0.5, False),
+        ]:
+            launcher._axes[1] = axis_y
+            launcher._update_stick_held()
+            self.assertEqual(launcher._stick_held[down], held, axis_y)
+            self.assertFalse(launcher._stick_held[0])
+
+
+if __name__ == "__main__":
+    unittest.main()